@@ -5,57 +5,193 @@
 # This module is part of SQLAlchemy and is released under
 # the MIT License: https://www.opensource.org/licenses/mit-license.php
 
+"""Dialect registry and default dialect importer.
+
+This module is deliberately free of import-time side effects beyond
+building a few small lookup tables: the ``registry`` / ``plugins``
+loaders are constructed on first attribute access and all import work
+happens inside resolver functions.  Keep it that way - new top-level
+imports here go back on the critical startup path of every program
+that imports SQLAlchemy.
+
+"""
+
 from __future__ import annotations
 
+from functools import lru_cache
+from importlib import import_module
+import sys
+from typing import Any
 from typing import Callable
 from typing import Optional
 from typing import Type
 from typing import TYPE_CHECKING
 
-from .. import util
-
 if TYPE_CHECKING:
     from ..engine.interfaces import Dialect
+    from ..util import PluginLoader
+
+    registry: PluginLoader
+    plugins: PluginLoader
 
 __all__ = ("mssql", "mysql", "oracle", "postgresql", "sqlite")
 
+# O(1) membership for the names this package can actually resolve;
+# unknown names skip the import machinery (and its ImportError
+# raise/catch) entirely and fall through to entrypoint lookup.
+_KNOWN_DIALECTS = frozenset(sys.intern(d) for d in __all__) | {"mariadb"}
 
-def _auto_fn(name: str) -> Optional[Callable[[], Type[Dialect]]]:
-    """default dialect importer.
+# fixed set of first-party dialects, so the module paths can be built
+# once rather than concatenated per lookup.  keys and values are
+# interned so lookups against them compare by pointer when the probe
+# string is itself interned (as sys.modules keys are)
+_DIALECT_MODPATH = {
+    sys.intern(d): sys.intern("sqlalchemy.dialects." + d) for d in __all__
+}
 
-    plugs into the :class:`.PluginLoader`
-    as a first-hit system.
-
-    """
-    if "." in name:
-        dialect, driver = name.split(".")
-    else:
-        dialect = name
-        driver = "base"
 
+def _resolve_mariadb(driver: str) -> Optional[Callable[[], Type[Dialect]]]:
+    # it's "OK" for us to hardcode here since _auto_fn is already
+    # hardcoded.   if mysql / mariadb etc were third party dialects
+    # they would just publish all the entrypoints, which would actually
+    # look much nicer.
+    modname = "sqlalchemy.dialects.mysql.mariadb"
+    module = sys.modules.get(modname)
+    if module is None:
+        try:
+            module = import_module(modname)
+        except ImportError:
+            return None
     try:
-        if dialect == "mariadb":
-            # it's "OK" for us to hardcode here since _auto_fn is already
-            # hardcoded.   if mysql / mariadb etc were third party dialects
-            # they would just publish all the entrypoints, which would actually
-            # look much nicer.
-            module = __import__(
-                "sqlalchemy.dialects.mysql.mariadb"
-            ).dialects.mysql.mariadb
-            return module.loader(driver)  # type: ignore
-        else:
-            module = __import__("sqlalchemy.dialects.%s" % (dialect,)).dialects
-            module = getattr(module, dialect)
+        # loader() imports the driver module; an unknown driver must
+        # surface as a plugin-lookup miss, not a raw ImportError
+        return module.loader(driver)  # type: ignore
     except ImportError:
         return None
 
-    if hasattr(module, driver):
-        module = getattr(module, driver)
-        return lambda: module.dialect
+
+_SPECIAL_RESOLVERS = {"mariadb": _resolve_mariadb}
+
+
+@lru_cache(maxsize=None)
+def _resolve(
+    dialect: str,
+    driver: str,
+    # bound as defaults so the hot body uses LOAD_FAST rather than
+    # global / builtin lookups; never passed by callers
+    _sys_modules_get: Callable[..., Any] = sys.modules.get,
+    _import_module: Callable[..., Any] = import_module,
+    _getattr: Callable[..., Any] = getattr,
+    _hasattr: Callable[..., bool] = hasattr,
+) -> Optional[Callable[[], Type[Dialect]]]:
+    """resolve a (dialect, driver) pair to a zero-argument loader
+    callable.
+
+    results, including misses, are memoized so that repeated lookups
+    of the same pair don't re-enter the import system.  default-driver
+    substitution happens in the caller, so registries with different
+    defaults share one cache.
+
+    """
+    if dialect not in _KNOWN_DIALECTS:
+        return None
+
+    special = _SPECIAL_RESOLVERS.get(dialect)
+    if special is not None:
+        return special(driver)
+
+    # an already-imported module is a plain dict hit in
+    # sys.modules; only fall through to the import machinery
+    # on the first resolution
+    modname = _DIALECT_MODPATH[dialect]
+    module = _sys_modules_get(modname)
+    if module is None:
+        try:
+            module = _import_module(modname)
+        except ImportError:
+            return None
+
+    if _hasattr(module, driver):
+        module = _getattr(module, driver)
+
+        # resolve the attribute chain once; the memoized loader then
+        # returns the dialect class with no per-call getattr.  binding
+        # via a default argument rather than a closure avoids the cell
+        # allocation, making the loader a plain LOAD_FAST + RETURN
+        def load(_cls: Type[Dialect] = module.dialect) -> Type[Dialect]:
+            return _cls
+
+        return load
     else:
         return None
 
 
-registry = util.PluginLoader("sqlalchemy.dialects", auto_fn=_auto_fn)
+def _clear_dialect_caches() -> None:
+    """reset memoized dialect resolution, including cached misses.
+
+    intended for test isolation, e.g. after installing or mocking a
+    DBAPI that a previous lookup recorded as absent.
+
+    """
+    _resolve.cache_clear()
+    reg = globals().get("registry")
+    if reg is not None:
+        reg.clear()
+
+
+class _DialectImporter:
+    """default dialect importer.
+
+    plugs into the :class:`.PluginLoader` as a first-hit system.  a
+    callable class rather than a closure so the default driver is an
+    inspectable attribute and instances pickle cleanly across
+    post-fork workers.
+
+    """
+
+    __slots__ = ("default_driver",)
+
+    def __init__(self, default_driver: str):
+        self.default_driver = default_driver
+
+    def __call__(self, name: str) -> Optional[Callable[[], Type[Dialect]]]:
+        # partition returns a fixed three-tuple without allocating a
+        # list the way split does
+        dialect, sep, driver = name.partition(".")
+        return _resolve(dialect, driver if sep else self.default_driver)
+
+
+_auto_fn = _DialectImporter("base")
+
+
+# resolution is cached at two levels: PluginLoader.impls memoizes
+# loader callables per name within each registry, and _resolve's
+# lru_cache memoizes the import-system work (including misses) across
+# all callers of _auto_fn.
+#
+# the loaders themselves are constructed lazily via PEP 562 so that
+# importing this package doesn't pull in util; once built they're
+# stashed in the module namespace and subsequent access bypasses
+# __getattr__ entirely.
+_plugin_loaders = {
+    "registry": ("sqlalchemy.dialects", _auto_fn),
+    "plugins": ("sqlalchemy.plugins", None),
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        group, auto_fn = _plugin_loaders[name]
+    except KeyError:
+        raise AttributeError(name) from None
+
+    from .. import util
+
+    loader = globals()[name] = util.PluginLoader(group, auto_fn=auto_fn)
+    return loader
+
 
-plugins = util.PluginLoader("sqlalchemy.plugins")
+def __dir__() -> list[str]:
+    # advertise the lazily-built loaders alongside whatever has
+    # actually been materialized so far
+    return sorted(set(globals()) | set(_plugin_loaders))
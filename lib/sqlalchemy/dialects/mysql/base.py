@@ -100,6 +100,16 @@ present in the pool for a fixed number of seconds::
 
     engine = create_engine('mysql+mysqldb://...', pool_recycle=3600)
 
+The :paramref:`_sa.create_engine.pool_use_lifo` option pairs well with
+``pool_recycle`` on MySQL / MariaDB; by using the most recently checked-in
+connection first, excess connections are allowed to go idle and be closed
+by the server's ``wait_timeout``, rather than all pooled connections being
+kept alive by round-robin use::
+
+    engine = create_engine(
+        'mysql+mysqldb://...', pool_recycle=3600, pool_use_lifo=True
+    )
+
 For more comprehensive disconnect detection of pooled connections, including
 accommodation of  server restarts and network issues, a pre-ping approach may
 be employed.  See :ref:`pool_disconnects` for current approaches.
@@ -392,6 +402,9 @@ The ``binary_prefix`` flag may or may not be supported by other MySQL drivers.
 
 SQLAlchemy itself cannot render this ``_binary`` prefix reliably, as it does
 not work with the NULL value, which is valid to be sent as a bound parameter.
+Because the introducer must therefore be chosen per value rather than baked
+into the compiled (and cached) statement text, rendering it in SQLAlchemy
+would re-introduce a per-row Python-level branch on every executemany.
 As the MySQL driver renders parameters directly into the SQL string, it's the
 most efficient place for this additional keyword to be passed.
 
@@ -1002,9 +1015,12 @@ from __future__ import annotations
 
 from array import array as _array
 from collections import defaultdict
-from itertools import compress
+import contextlib
+from itertools import chain
 import re
+import sys
 from typing import cast
+import zlib
 
 from . import reflection as _reflection
 from .enumerated import ENUM
@@ -1018,7 +1034,6 @@ from .types import _FloatType
 from .types import _IntegerType
 from .types import _MatchType
 from .types import _NumericType
-from .types import _StringType
 from .types import BIGINT
 from .types import BIT
 from .types import CHAR
@@ -1073,12 +1088,12 @@ from ...types import BOOLEAN
 from ...types import DATE
 from ...types import UUID
 from ...types import VARBINARY
-from ...util import topological
 
 
-SET_RE = re.compile(
-    r"\s*SET\s+(?:(?:GLOBAL|SESSION)\s+)?\w", re.I | re.UNICODE
-)
+# server version strings are parsed on every first-connect; compile the
+# patterns once rather than per call
+_server_version_delimiter_re = re.compile(r"[.\-+]")
+_server_version_token_re = re.compile(r"^(?:(\d+)(?:a|b|c)?|(MariaDB\w*))$")
 
 # old names
 MSTime = TIME
@@ -1128,6 +1143,10 @@ colspecs = {
 }
 
 # Everything 3.23 through 5.1 excepting OpenGIS types.
+# keys are interned so that per-column lookups during reflection hit
+# the pointer-equality fast path.  deliberately left a plain mutable
+# dict; third party libraries register additional reflected types by
+# assigning into it.
 ischema_names = {
     "bigint": BIGINT,
     "binary": BINARY,
@@ -1166,6 +1185,11 @@ ischema_names = {
     "varchar": VARCHAR,
     "year": YEAR,
 }
+ischema_names = {sys.intern(k): v for k, v in ischema_names.items()}
+
+# 2**64 - 1, the upper bound MySQL documents for LIMIT when an OFFSET
+# is given without a LIMIT
+_MAX_BIGINT_UNSIGNED = "18446744073709551615"
 
 
 class MySQLExecutionContext(default.DefaultExecutionContext):
@@ -1215,8 +1239,12 @@ class MySQLCompiler(compiler.SQLCompiler):
     render_table_with_column_in_update_from = True
     """Overridden from base SQLCompiler value"""
 
-    extract_map = compiler.SQLCompiler.extract_map.copy()
-    extract_map.update({"milliseconds": "millisecond"})
+    extract_map = util.immutabledict(
+        util.update_copy(
+            compiler.SQLCompiler.extract_map,
+            {"milliseconds": "millisecond"},
+        )
+    )
 
     def default_from(self):
         """Called when a ``SELECT`` statement has no froms,
@@ -1248,7 +1276,8 @@ class MySQLCompiler(compiler.SQLCompiler):
     def visit_sequence(self, seq, **kw):
         return "nextval(%s)" % self.preparer.format_sequence(seq)
 
-    def visit_sysdate_func(self, fn, **kw):
+    @staticmethod
+    def visit_sysdate_func(fn, **kw):
         return "SYSDATE()"
 
     def _render_json_extract_from_binary(self, binary, operator, **kw):
@@ -1256,72 +1285,69 @@ class MySQLCompiler(compiler.SQLCompiler):
         # order in which they appear in the SQL String as this is used
         # by positional parameter rendering
 
+        left = self.process(binary.left, **kw)
+        right = self.process(binary.right, **kw)
+
         if binary.type._type_affinity is sqltypes.JSON:
-            return "JSON_EXTRACT(%s, %s)" % (
-                self.process(binary.left, **kw),
-                self.process(binary.right, **kw),
-            )
+            return f"JSON_EXTRACT({left}, {right})"
 
         # for non-JSON, MySQL doesn't handle JSON null at all so it has to
         # be explicit
-        case_expression = "CASE JSON_EXTRACT(%s, %s) WHEN 'null' THEN NULL" % (
-            self.process(binary.left, **kw),
-            self.process(binary.right, **kw),
+        case_expression = (
+            f"CASE JSON_EXTRACT({left}, {right}) WHEN 'null' THEN NULL"
         )
 
-        if binary.type._type_affinity is sqltypes.Integer:
-            type_expression = (
-                "ELSE CAST(JSON_EXTRACT(%s, %s) AS SIGNED INTEGER)"
-                % (
-                    self.process(binary.left, **kw),
-                    self.process(binary.right, **kw),
-                )
-            )
-        elif binary.type._type_affinity is sqltypes.Numeric:
-            if (
-                binary.type.scale is not None
-                and binary.type.precision is not None
-            ):
-                # using DECIMAL here because MySQL does not recognize NUMERIC
-                type_expression = (
-                    "ELSE CAST(JSON_EXTRACT(%s, %s) AS DECIMAL(%s, %s))"
-                    % (
-                        self.process(binary.left, **kw),
-                        self.process(binary.right, **kw),
-                        binary.type.precision,
-                        binary.type.scale,
-                    )
-                )
-            else:
-                # FLOAT / REAL not added in MySQL til 8.0.17
-                type_expression = (
-                    "ELSE JSON_EXTRACT(%s, %s)+0.0000000000000000000000"
-                    % (
-                        self.process(binary.left, **kw),
-                        self.process(binary.right, **kw),
-                    )
-                )
-        elif binary.type._type_affinity is sqltypes.Boolean:
+        if binary.type._type_affinity is sqltypes.Boolean:
             # the NULL handling is particularly weird with boolean, so
             # explicitly return true/false constants
             type_expression = "WHEN true THEN true ELSE false"
-        elif binary.type._type_affinity is sqltypes.String:
-            # (gord): this fails with a JSON value that's a four byte unicode
-            # string.  SQLite has the same problem at the moment
-            # (zzzeek): I'm not really sure.  let's take a look at a test case
-            # that hits each backend and maybe make a requires rule for it?
-            type_expression = "ELSE JSON_UNQUOTE(JSON_EXTRACT(%s, %s))" % (
-                self.process(binary.left, **kw),
-                self.process(binary.right, **kw),
-            )
         else:
-            # other affinity....this is not expected right now
-            type_expression = "ELSE JSON_EXTRACT(%s, %s)" % (
-                self.process(binary.left, **kw),
-                self.process(binary.right, **kw),
-            )
+            if self.positional:
+                # the remaining branches render the operands a second
+                # time; for positional paramstyles each textual
+                # occurrence must go through process() so that parameter
+                # collection stays aligned with the placeholders.  for
+                # named paramstyles, reuse the strings rendered above.
+                left = self.process(binary.left, **kw)
+                right = self.process(binary.right, **kw)
+
+            if binary.type._type_affinity is sqltypes.Integer:
+                type_expression = (
+                    f"ELSE CAST(JSON_EXTRACT({left}, {right}) "
+                    "AS SIGNED INTEGER)"
+                )
+            elif binary.type._type_affinity is sqltypes.Numeric:
+                if (
+                    binary.type.scale is not None
+                    and binary.type.precision is not None
+                ):
+                    # using DECIMAL here because MySQL does not
+                    # recognize NUMERIC
+                    type_expression = (
+                        f"ELSE CAST(JSON_EXTRACT({left}, {right}) AS "
+                        f"DECIMAL({binary.type.precision}, "
+                        f"{binary.type.scale}))"
+                    )
+                else:
+                    # FLOAT / REAL not added in MySQL til 8.0.17
+                    type_expression = (
+                        f"ELSE JSON_EXTRACT({left}, {right})"
+                        "+0.0000000000000000000000"
+                    )
+            elif binary.type._type_affinity is sqltypes.String:
+                # (gord): this fails with a JSON value that's a four byte
+                # unicode string.  SQLite has the same problem at the moment
+                # (zzzeek): I'm not really sure.  let's take a look at a test
+                # case that hits each backend and maybe make a requires rule
+                # for it?
+                type_expression = (
+                    f"ELSE JSON_UNQUOTE(JSON_EXTRACT({left}, {right}))"
+                )
+            else:
+                # other affinity....this is not expected right now
+                type_expression = f"ELSE JSON_EXTRACT({left}, {right})"
 
-        return case_expression + " " + type_expression + " END"
+        return f"{case_expression} {type_expression} END"
 
     def visit_json_getitem_op_binary(self, binary, operator, **kw):
         return self._render_json_extract_from_binary(binary, operator, **kw)
@@ -1337,17 +1363,33 @@ class MySQLCompiler(compiler.SQLCompiler):
                 coercions.expect(roles.DMLColumnRole, key)
                 for key in on_duplicate._parameter_ordering
             ]
-            ordered_keys = set(parameter_ordering)
-            cols = [
-                statement.table.c[key]
-                for key in parameter_ordering
-                if key in statement.table.c
-            ] + [c for c in statement.table.c if c.key not in ordered_keys]
+            # the reordered column list depends only on the table and
+            # the ordering, so memoize it across compiles; bulk upserts
+            # re-enter here once per executemany batch
+            cache = self.dialect._odku_col_cache
+            cache_key = (statement.table, tuple(parameter_ordering))
+            try:
+                cols, col_keys = cache[cache_key]
+            except KeyError:
+                ordered_keys = set(parameter_ordering)
+                cols = [
+                    statement.table.c[key]
+                    for key in parameter_ordering
+                    if key in statement.table.c
+                ] + [
+                    c for c in statement.table.c if c.key not in ordered_keys
+                ]
+                col_keys = {c.key for c in cols}
+                cache[cache_key] = (cols, col_keys)
         else:
             cols = statement.table.c
+            col_keys = None
 
         clauses = []
 
+        # IdentifierPreparer.quote memoizes per distinct name already
+        quote = self.preparer.quote
+
         requires_mysql8_alias = statement.select is None and (
             self.dialect._requires_alias_for_on_duplicate_key
         )
@@ -1381,12 +1423,11 @@ class MySQLCompiler(compiler.SQLCompiler):
                     ):
                         if requires_mysql8_alias:
                             column_literal_clause = (
-                                f"{_on_dup_alias_name}."
-                                f"{self.preparer.quote(obj.name)}"
+                                f"{_on_dup_alias_name}.{quote(obj.name)}"
                             )
                         else:
                             column_literal_clause = (
-                                f"VALUES({self.preparer.quote(obj.name)})"
+                                f"VALUES({quote(obj.name)})"
                             )
                         return literal_column(column_literal_clause)
                     else:
@@ -1396,10 +1437,12 @@ class MySQLCompiler(compiler.SQLCompiler):
                 val = visitors.replacement_traverse(val, {}, replace)
                 value_text = self.process(val.self_group(), use_schema=False)
 
-            name_text = self.preparer.quote(column.name)
+            name_text = quote(column.name)
             clauses.append("%s = %s" % (name_text, value_text))
 
-        non_matching = set(on_duplicate.update) - {c.key for c in cols}
+        if col_keys is None:
+            col_keys = {c.key for c in cols}
+        non_matching = set(on_duplicate.update) - col_keys
         if non_matching:
             util.warn(
                 "Additional column names not matching "
@@ -1431,22 +1474,17 @@ class MySQLCompiler(compiler.SQLCompiler):
             self.process(binary.right, **kw),
         )
 
-    _match_valid_flag_combinations = frozenset(
-        (
-            # (boolean_mode, natural_language, query_expansion)
-            (False, False, False),
-            (True, False, False),
-            (False, True, False),
-            (False, False, True),
-            (False, True, True),
-        )
-    )
-
-    _match_flag_expressions = (
-        "IN BOOLEAN MODE",
-        "IN NATURAL LANGUAGE MODE",
-        "WITH QUERY EXPANSION",
-    )
+    # (boolean_mode, natural_language, query_expansion) -> rendered
+    # AGAINST suffix; combinations not present here are invalid
+    _match_against_suffixes = {
+        (False, False, False): "",
+        (True, False, False): " IN BOOLEAN MODE",
+        (False, True, False): " IN NATURAL LANGUAGE MODE",
+        (False, False, True): " WITH QUERY EXPANSION",
+        (False, True, True): (
+            " IN NATURAL LANGUAGE MODE WITH QUERY EXPANSION"
+        ),
+    }
 
     def visit_mysql_match(self, element, **kw):
         return self.visit_match_op_binary(element, element.operator, **kw)
@@ -1465,51 +1503,101 @@ class MySQLCompiler(compiler.SQLCompiler):
 
         flag_combination = (boolean_mode, natural_language, query_expansion)
 
-        if flag_combination not in self._match_valid_flag_combinations:
-            flags = (
-                "in_boolean_mode=%s" % boolean_mode,
-                "in_natural_language_mode=%s" % natural_language,
-                "with_query_expansion=%s" % query_expansion,
+        try:
+            suffix = self._match_against_suffixes[flag_combination]
+        except KeyError:
+            flags = ", ".join(
+                (
+                    "in_boolean_mode=%s" % boolean_mode,
+                    "in_natural_language_mode=%s" % natural_language,
+                    "with_query_expansion=%s" % query_expansion,
+                )
             )
 
-            flags = ", ".join(flags)
-
-            raise exc.CompileError("Invalid MySQL match flags: %s" % flags)
+            raise exc.CompileError(
+                "Invalid MySQL match flags: %s" % flags
+            ) from None
 
         match_clause = binary.left
         match_clause = self.process(match_clause, **kw)
         against_clause = self.process(binary.right, **kw)
 
-        if any(flag_combination):
-            flag_expressions = compress(
-                self._match_flag_expressions,
-                flag_combination,
+        return f"MATCH ({match_clause}) AGAINST ({against_clause}{suffix})"
+
+    def get_from_hint_text(self, table, text):
+        return text
+
+    def visit_typeclause(self, typeclause, type_=None, **kw):
+        if type_ is not None:
+            return self._typeclause_text(type_)
+
+        # the rendered CAST type for a given type instance is invariant
+        # per dialect, apart from _support_float_cast which isn't known
+        # until initialize() and so participates in the key; cache the
+        # string so that repeated CASTs against the same types, e.g.
+        # JSON index expressions, skip the isinstance chain and the
+        # type compiler
+        cache = self.dialect._typeclause_cast_cache
+        key = (typeclause.type, self.dialect._support_float_cast)
+        try:
+            return cache[key]
+        except KeyError:
+            result = cache[key] = self._typeclause_text(
+                typeclause.type.dialect_impl(self.dialect)
             )
+            return result
 
-            against_clause = [against_clause]
-            against_clause.extend(flag_expressions)
+    def _typeclause_typedecorator(self, type_):
+        return self._typeclause_text(type_.impl)
 
-            against_clause = " ".join(against_clause)
+    def _typeclause_integer(self, type_):
+        if getattr(type_, "unsigned", False):
+            return "UNSIGNED INTEGER"
+        else:
+            return "SIGNED INTEGER"
 
-        return "MATCH (%s) AGAINST (%s)" % (match_clause, against_clause)
+    def _typeclause_datetime(self, type_):
+        return "DATETIME"
 
-    def get_from_hint_text(self, table, text):
-        return text
+    def _typeclause_process(self, type_):
+        return self.dialect.type_compiler_instance.process(type_)
 
-    def visit_typeclause(self, typeclause, type_=None, **kw):
-        if type_ is None:
-            type_ = typeclause.type.dialect_impl(self.dialect)
-        if isinstance(type_, sqltypes.TypeDecorator):
-            return self.visit_typeclause(typeclause, type_.impl, **kw)
-        elif isinstance(type_, sqltypes.Integer):
-            if getattr(type_, "unsigned", False):
-                return "UNSIGNED INTEGER"
-            else:
-                return "SIGNED INTEGER"
-        elif isinstance(type_, sqltypes.TIMESTAMP):
-            return "DATETIME"
-        elif isinstance(
-            type_,
+    def _typeclause_string(self, type_):
+        adapted = CHAR._adapt_string_for_cast(type_)
+        return self.dialect.type_compiler_instance.process(adapted)
+
+    def _typeclause_binary(self, type_):
+        return "BINARY"
+
+    def _typeclause_json(self, type_):
+        return "JSON"
+
+    def _typeclause_numeric(self, type_):
+        return self.dialect.type_compiler_instance.process(type_).replace(
+            "NUMERIC", "DECIMAL"
+        )
+
+    def _typeclause_float(self, type_):
+        if self.dialect._support_float_cast:
+            return self.dialect.type_compiler_instance.process(type_)
+        else:
+            return None
+
+    def _typeclause_unsupported(self, type_):
+        return None
+
+    @classmethod
+    def _typeclause_handler_for(cls, type_cls):
+        """resolve the CAST rendering handler for an exact type class,
+        preserving the match order of the former isinstance chain."""
+        if issubclass(type_cls, sqltypes.TypeDecorator):
+            return cls._typeclause_typedecorator
+        elif issubclass(type_cls, sqltypes.Integer):
+            return cls._typeclause_integer
+        elif issubclass(type_cls, sqltypes.TIMESTAMP):
+            return cls._typeclause_datetime
+        elif issubclass(
+            type_cls,
             (
                 sqltypes.DECIMAL,
                 sqltypes.DateTime,
@@ -1517,27 +1605,36 @@ class MySQLCompiler(compiler.SQLCompiler):
                 sqltypes.Time,
             ),
         ):
-            return self.dialect.type_compiler_instance.process(type_)
-        elif isinstance(type_, sqltypes.String) and not isinstance(
-            type_, (ENUM, SET)
-        ):
-            adapted = CHAR._adapt_string_for_cast(type_)
-            return self.dialect.type_compiler_instance.process(adapted)
-        elif isinstance(type_, sqltypes._Binary):
-            return "BINARY"
-        elif isinstance(type_, sqltypes.JSON):
-            return "JSON"
-        elif isinstance(type_, sqltypes.NUMERIC):
-            return self.dialect.type_compiler_instance.process(type_).replace(
-                "NUMERIC", "DECIMAL"
-            )
-        elif (
-            isinstance(type_, sqltypes.Float)
-            and self.dialect._support_float_cast
+            return cls._typeclause_process
+        elif issubclass(type_cls, sqltypes.String) and not issubclass(
+            type_cls, (ENUM, SET)
         ):
-            return self.dialect.type_compiler_instance.process(type_)
+            return cls._typeclause_string
+        elif issubclass(type_cls, sqltypes._Binary):
+            return cls._typeclause_binary
+        elif issubclass(type_cls, sqltypes.JSON):
+            return cls._typeclause_json
+        elif issubclass(type_cls, sqltypes.NUMERIC):
+            return cls._typeclause_numeric
+        elif issubclass(type_cls, sqltypes.Float):
+            return cls._typeclause_float
         else:
-            return None
+            return cls._typeclause_unsupported
+
+    # exact type class -> handler, populated lazily; resolution depends
+    # only on the class, so the memo is shared across compilers
+    _typeclause_dispatch = {}
+
+    def _typeclause_text(self, type_):
+        type_cls = type_.__class__
+        dispatch = self._typeclause_dispatch
+        try:
+            handler = dispatch[type_cls]
+        except KeyError:
+            handler = dispatch[type_cls] = self._typeclause_handler_for(
+                type_cls
+            )
+        return handler(self, type_)
 
     def visit_cast(self, cast, **kw):
         type_ = self.process(cast.typeclause)
@@ -1555,16 +1652,22 @@ class MySQLCompiler(compiler.SQLCompiler):
 
     def render_literal_value(self, value, type_):
         value = super().render_literal_value(value, type_)
-        if self.dialect._backslash_escapes:
+        # the "in" scan is a cheap memchr; most literals contain no
+        # backslash, in which case replace()'s copy is skipped entirely
+        if self.dialect._backslash_escapes and "\\" in value:
             value = value.replace("\\", "\\\\")
         return value
 
     # override native_boolean=False behavior here, as
     # MySQL still supports native boolean
-    def visit_true(self, element, **kw):
+    # constant-returning visitors; staticmethods skip the bound-method
+    # allocation on each dispatch
+    @staticmethod
+    def visit_true(element, **kw):
         return "true"
 
-    def visit_false(self, element, **kw):
+    @staticmethod
+    def visit_false(element, **kw):
         return "false"
 
     def get_select_precolumns(self, select, **kw):
@@ -1587,51 +1690,62 @@ class MySQLCompiler(compiler.SQLCompiler):
 
         return super().get_select_precolumns(select, **kw)
 
+    # indexed by (full << 1) | isouter; MySQL renders FULL OUTER JOIN
+    # for full regardless of isouter
+    _join_types = (
+        " INNER JOIN ",
+        " LEFT OUTER JOIN ",
+        " FULL OUTER JOIN ",
+        " FULL OUTER JOIN ",
+    )
+
     def visit_join(self, join, asfrom=False, from_linter=None, **kwargs):
         if from_linter:
             from_linter.edges.add((join.left, join.right))
 
-        if join.full:
-            join_type = " FULL OUTER JOIN "
-        elif join.isouter:
-            join_type = " LEFT OUTER JOIN "
-        else:
-            join_type = " INNER JOIN "
+        join_type = self._join_types[
+            (bool(join.full) << 1) | bool(join.isouter)
+        ]
 
-        return "".join(
-            (
-                self.process(
-                    join.left, asfrom=True, from_linter=from_linter, **kwargs
-                ),
-                join_type,
-                self.process(
-                    join.right, asfrom=True, from_linter=from_linter, **kwargs
-                ),
-                " ON ",
-                self.process(join.onclause, from_linter=from_linter, **kwargs),
-            )
+        left = self.process(
+            join.left, asfrom=True, from_linter=from_linter, **kwargs
+        )
+        right = self.process(
+            join.right, asfrom=True, from_linter=from_linter, **kwargs
+        )
+        onclause = self.process(
+            join.onclause, from_linter=from_linter, **kwargs
         )
+        return f"{left}{join_type}{right} ON {onclause}"
 
     def for_update_clause(self, select, **kw):
-        if select._for_update_arg.read:
+        for_update_arg = select._for_update_arg
+
+        if for_update_arg.read:
             tmp = " LOCK IN SHARE MODE"
         else:
             tmp = " FOR UPDATE"
 
-        if select._for_update_arg.of and self.dialect.supports_for_update_of:
-            tables = util.OrderedSet()
-            for c in select._for_update_arg.of:
-                tables.update(sql_util.surface_selectables_only(c))
+        if for_update_arg.of and self.dialect.supports_for_update_of:
+            # plain dict as an insertion-ordered set; cheaper than
+            # util.OrderedSet for the typically tiny "of" list
+            tables = {
+                t: None
+                for c in for_update_arg.of
+                for t in sql_util.surface_selectables_only(c)
+            }
 
             tmp += " OF " + ", ".join(
-                self.process(table, ashint=True, use_schema=False, **kw)
-                for table in tables
+                [
+                    self.process(table, ashint=True, use_schema=False, **kw)
+                    for table in tables
+                ]
             )
 
-        if select._for_update_arg.nowait:
+        if for_update_arg.nowait:
             tmp += " NOWAIT"
 
-        if select._for_update_arg.skip_locked:
+        if for_update_arg.skip_locked:
             tmp += " SKIP LOCKED"
 
         return tmp
@@ -1650,30 +1764,26 @@ class MySQLCompiler(compiler.SQLCompiler):
             select._offset_clause,
         )
 
-        if limit_clause is None and offset_clause is None:
-            return ""
-        elif offset_clause is not None:
+        if offset_clause is None:
+            if limit_clause is None:
+                return ""
+            # No offset provided, so just use the limit
+            return f" \n LIMIT {self.process(limit_clause, **kw)}"
+
+        offset = self.process(offset_clause, **kw)
+        if limit_clause is None:
             # As suggested by the MySQL docs, need to apply an
             # artificial limit if one wasn't provided
             # https://dev.mysql.com/doc/refman/5.0/en/select.html
-            if limit_clause is None:
-                # TODO: remove ??
-                # hardwire the upper limit.  Currently
-                # needed consistent with the usage of the upper
-                # bound as part of MySQL's "syntax" for OFFSET with
-                # no LIMIT.
-                return " \n LIMIT %s, %s" % (
-                    self.process(offset_clause, **kw),
-                    "18446744073709551615",
-                )
-            else:
-                return " \n LIMIT %s, %s" % (
-                    self.process(offset_clause, **kw),
-                    self.process(limit_clause, **kw),
-                )
+            #
+            # TODO: remove ??
+            # hardwire the upper limit.  Currently
+            # needed consistent with the usage of the upper
+            # bound as part of MySQL's "syntax" for OFFSET with
+            # no LIMIT.
+            return f" \n LIMIT {offset}, {_MAX_BIGINT_UNSIGNED}"
         else:
-            # No offset provided, so just use the limit
-            return " \n LIMIT %s" % (self.process(limit_clause, **kw),)
+            return f" \n LIMIT {offset}, {self.process(limit_clause, **kw)}"
 
     def update_limit_clause(self, update_stmt):
         limit = update_stmt.kwargs.get("%s_limit" % self.dialect.name, None)
@@ -1685,8 +1795,10 @@ class MySQLCompiler(compiler.SQLCompiler):
     def update_tables_clause(self, update_stmt, from_table, extra_froms, **kw):
         kw["asfrom"] = True
         return ", ".join(
-            t._compiler_dispatch(self, **kw)
-            for t in [from_table] + list(extra_froms)
+            [
+                t._compiler_dispatch(self, **kw)
+                for t in chain((from_table,), extra_froms)
+            ]
         )
 
     def update_from_clause(
@@ -1709,23 +1821,19 @@ class MySQLCompiler(compiler.SQLCompiler):
         """Render the DELETE .. USING clause specific to MySQL."""
         kw["asfrom"] = True
         return "USING " + ", ".join(
-            t._compiler_dispatch(self, fromhints=from_hints, **kw)
-            for t in [from_table] + extra_froms
+            [
+                t._compiler_dispatch(self, fromhints=from_hints, **kw)
+                for t in chain((from_table,), extra_froms)
+            ]
         )
 
     def visit_empty_set_expr(self, element_types, **kw):
+        names = [f"_in_{idx}" for idx in range(len(element_types))]
+        outer = ", ".join(names)
+        inner = ", ".join([f"1 AS {name}" for name in names])
         return (
-            "SELECT %(outer)s FROM (SELECT %(inner)s) "
+            f"SELECT {outer} FROM (SELECT {inner}) "
             "as _empty_set WHERE 1!=1"
-            % {
-                "inner": ", ".join(
-                    "1 AS _in_%s" % idx
-                    for idx, type_ in enumerate(element_types)
-                ),
-                "outer": ", ".join(
-                    "_in_%s" % idx for idx, type_ in enumerate(element_types)
-                ),
-            }
         )
 
     def visit_is_distinct_from_binary(self, binary, operator, **kw):
@@ -1741,96 +1849,136 @@ class MySQLCompiler(compiler.SQLCompiler):
         )
 
     def _mariadb_regexp_flags(self, flags, pattern, **kw):
-        return "CONCAT('(?', %s, ')', %s)" % (
-            self.render_literal_value(flags, sqltypes.STRINGTYPE),
-            self.process(pattern, **kw),
-        )
+        flags_literal = self.render_literal_value(flags, sqltypes.STRINGTYPE)
+        return f"CONCAT('(?', {flags_literal}, ')', {self.process(pattern, **kw)})"  # noqa: E501
 
-    def _regexp_match(self, op_string, binary, operator, **kw):
+    def _regexp_match(self, op_string, negate, binary, operator, **kw):
+        # operand rendering stays in SQL-text order for positional
+        # parameter collection
         flags = binary.modifiers["flags"]
         if flags is None:
             return self._generate_generic_binary(binary, op_string, **kw)
-        elif self.dialect.is_mariadb:
-            return "%s%s%s" % (
-                self.process(binary.left, **kw),
-                op_string,
-                self._mariadb_regexp_flags(flags, binary.right),
-            )
+
+        left = self.process(binary.left, **kw)
+        if self.dialect.is_mariadb:
+            right = self._mariadb_regexp_flags(flags, binary.right)
+            return f"{left}{op_string}{right}"
         else:
-            text = "REGEXP_LIKE(%s, %s, %s)" % (
-                self.process(binary.left, **kw),
-                self.process(binary.right, **kw),
-                self.render_literal_value(flags, sqltypes.STRINGTYPE),
+            right = self.process(binary.right, **kw)
+            flags_literal = self.render_literal_value(
+                flags, sqltypes.STRINGTYPE
             )
-            if op_string == " NOT REGEXP ":
-                return "NOT %s" % text
+            text = f"REGEXP_LIKE({left}, {right}, {flags_literal})"
+            if negate:
+                return "NOT " + text
             else:
                 return text
 
     def visit_regexp_match_op_binary(self, binary, operator, **kw):
-        return self._regexp_match(" REGEXP ", binary, operator, **kw)
+        return self._regexp_match(" REGEXP ", False, binary, operator, **kw)
 
     def visit_not_regexp_match_op_binary(self, binary, operator, **kw):
-        return self._regexp_match(" NOT REGEXP ", binary, operator, **kw)
+        return self._regexp_match(
+            " NOT REGEXP ", True, binary, operator, **kw
+        )
 
     def visit_regexp_replace_op_binary(self, binary, operator, **kw):
         flags = binary.modifiers["flags"]
+        left = self.process(binary.left, **kw)
         if flags is None:
-            return "REGEXP_REPLACE(%s, %s)" % (
-                self.process(binary.left, **kw),
-                self.process(binary.right, **kw),
-            )
+            return f"REGEXP_REPLACE({left}, {self.process(binary.right, **kw)})"  # noqa: E501
         elif self.dialect.is_mariadb:
-            return "REGEXP_REPLACE(%s, %s, %s)" % (
-                self.process(binary.left, **kw),
-                self._mariadb_regexp_flags(flags, binary.right.clauses[0]),
-                self.process(binary.right.clauses[1], **kw),
+            pattern = self._mariadb_regexp_flags(
+                flags, binary.right.clauses[0]
             )
+            replacement = self.process(binary.right.clauses[1], **kw)
+            return f"REGEXP_REPLACE({left}, {pattern}, {replacement})"
         else:
-            return "REGEXP_REPLACE(%s, %s, %s)" % (
-                self.process(binary.left, **kw),
-                self.process(binary.right, **kw),
-                self.render_literal_value(flags, sqltypes.STRINGTYPE),
+            right = self.process(binary.right, **kw)
+            flags_literal = self.render_literal_value(
+                flags, sqltypes.STRINGTYPE
             )
+            return f"REGEXP_REPLACE({left}, {right}, {flags_literal})"
+
+
+# CREATE TABLE options whose rendered name or joiner differs from the
+# default "<OPTION>=<value>"; precomputed so option rendering is a dict
+# get instead of per-option membership tests and str.replace calls
+_TABLE_OPTION_RENDER = {
+    "DATA_DIRECTORY": ("DATA DIRECTORY", "="),
+    "INDEX_DIRECTORY": ("INDEX DIRECTORY", "="),
+    "DEFAULT_CHARACTER_SET": ("DEFAULT CHARACTER SET", " "),
+    "CHARACTER_SET": ("CHARACTER SET", " "),
+    "DEFAULT_CHARSET": ("DEFAULT CHARSET", "="),
+    "DEFAULT_COLLATE": ("DEFAULT COLLATE", "="),
+    "TABLESPACE": ("TABLESPACE", " "),
+    "COLLATE": ("COLLATE", " "),
+}
+
+# the partition option dependency graph is total, so its topological
+# sort is this fixed sequence; rendered names precomputed alongside
+_PARTITION_OPTION_ORDER = (
+    ("PARTITION_BY", "PARTITION BY"),
+    ("PARTITIONS", "PARTITIONS"),
+    ("SUBPARTITION_BY", "SUBPARTITION BY"),
+    ("SUBPARTITIONS", "SUBPARTITIONS"),
+)
+
+_PARTITION_OPTIONS = frozenset(opt for opt, _ in _PARTITION_OPTION_ORDER)
+
+# exact constraint class -> (DROP qualifier, whether the constraint
+# name is rendered); a None qualifier marks the CHECK case, which
+# depends on mysql vs mariadb at compile time
+_DROP_CONSTRAINT_QUAL = {
+    sa_schema.ForeignKeyConstraint: ("FOREIGN KEY ", True),
+    sa_schema.PrimaryKeyConstraint: ("PRIMARY KEY ", False),
+    sa_schema.UniqueConstraint: ("INDEX ", True),
+    sa_schema.CheckConstraint: (None, True),
+}
 
 
 class MySQLDDLCompiler(compiler.DDLCompiler):
     def get_column_specification(self, column, **kw):
         """Builds column DDL."""
+        dialect = self.dialect
+        computed = column.computed
+
         if (
-            self.dialect.is_mariadb is True
-            and column.computed is not None
+            dialect.is_mariadb is True
+            and computed is not None
             and column._user_defined_nullable is SchemaConst.NULL_UNSPECIFIED
         ):
             column.nullable = True
-        colspec = [
-            self.preparer.format_column(column),
-            self.dialect.type_compiler_instance.process(
-                column.type, type_expression=column
-            ),
-        ]
-
-        if column.computed is not None:
-            colspec.append(self.process(column.computed))
-
-        is_timestamp = isinstance(
-            column.type._unwrapped_dialect_impl(self.dialect),
-            sqltypes.TIMESTAMP,
+        name = self.preparer.format_column(column)
+        type_spec = dialect.type_compiler_instance.process(
+            column.type, type_expression=column
         )
 
-        if not column.nullable:
-            colspec.append("NOT NULL")
+        # each optional fragment is "" or begins with a space, so the
+        # final f-string needs no join over an intermediate list
+        if computed is not None:
+            computed_spec = " " + self.process(computed)
+        else:
+            computed_spec = ""
 
+        if not column.nullable:
+            null_spec = " NOT NULL"
         # see: https://docs.sqlalchemy.org/en/latest/dialects/mysql.html#mysql_timestamp_null  # noqa
-        elif column.nullable and is_timestamp:
-            colspec.append("NULL")
+        elif isinstance(
+            column.type._unwrapped_dialect_impl(dialect),
+            sqltypes.TIMESTAMP,
+        ):
+            null_spec = " NULL"
+        else:
+            null_spec = ""
 
         comment = column.comment
         if comment is not None:
-            literal = self.sql_compiler.render_literal_value(
+            comment_spec = " COMMENT " + self.sql_compiler.render_literal_value(  # noqa: E501
                 comment, sqltypes.String()
             )
-            colspec.append("COMMENT " + literal)
+        else:
+            comment_spec = ""
 
         if (
             column.table is not None
@@ -1840,107 +1988,81 @@ class MySQLDDLCompiler(compiler.DDLCompiler):
                 or isinstance(column.server_default, sa_schema.Identity)
             )
             and not (
-                self.dialect.supports_sequences
+                dialect.supports_sequences
                 and isinstance(column.default, sa_schema.Sequence)
                 and not column.default.optional
             )
         ):
-            colspec.append("AUTO_INCREMENT")
+            default_spec = " AUTO_INCREMENT"
         else:
             default = self.get_column_default_string(column)
-            if default is not None:
-                if (
-                    isinstance(
-                        column.server_default.arg, functions.FunctionElement
-                    )
-                    and self.dialect._support_default_function
-                ):
-                    colspec.append(f"DEFAULT ({default})")
-                else:
-                    colspec.append("DEFAULT " + default)
-        return " ".join(colspec)
+            if default is None:
+                default_spec = ""
+            elif (
+                isinstance(
+                    column.server_default.arg, functions.FunctionElement
+                )
+                and dialect._support_default_function
+            ):
+                default_spec = f" DEFAULT ({default})"
+            else:
+                default_spec = " DEFAULT " + default
+
+        return (
+            f"{name} {type_spec}{computed_spec}{null_spec}"
+            f"{comment_spec}{default_spec}"
+        )
 
     def post_create_table(self, table):
         """Build table-level CREATE options like ENGINE and COLLATE."""
 
         table_opts = []
 
+        prefix = self.dialect.name + "_"
+        prefix_len = len(prefix)
         opts = {
-            k[len(self.dialect.name) + 1 :].upper(): v
+            k[prefix_len:].upper(): v
             for k, v in table.kwargs.items()
-            if k.startswith("%s_" % self.dialect.name)
+            if k.startswith(prefix)
         }
 
         if table.comment is not None:
             opts["COMMENT"] = table.comment
 
-        partition_options = [
-            "PARTITION_BY",
-            "PARTITIONS",
-            "SUBPARTITIONS",
-            "SUBPARTITION_BY",
-        ]
-
-        nonpart_options = set(opts).difference(partition_options)
-        part_options = set(opts).intersection(partition_options)
-
-        for opt in topological.sort(
-            [
-                ("DEFAULT_CHARSET", "COLLATE"),
-                ("DEFAULT_CHARACTER_SET", "COLLATE"),
-                ("CHARSET", "COLLATE"),
-                ("CHARACTER_SET", "COLLATE"),
-            ],
-            nonpart_options,
-        ):
+        def _render_arg(opt):
             arg = opts[opt]
             if opt in _reflection._options_of_type_string:
                 arg = self.sql_compiler.render_literal_value(
                     arg, sqltypes.String()
                 )
+            return arg
 
-            if opt in (
-                "DATA_DIRECTORY",
-                "INDEX_DIRECTORY",
-                "DEFAULT_CHARACTER_SET",
-                "CHARACTER_SET",
-                "DEFAULT_CHARSET",
-                "DEFAULT_COLLATE",
-            ):
-                opt = opt.replace("_", " ")
-
-            joiner = "="
-            if opt in (
-                "TABLESPACE",
-                "DEFAULT CHARACTER SET",
-                "CHARACTER SET",
-                "COLLATE",
-            ):
-                joiner = " "
-
-            table_opts.append(joiner.join((opt, arg)))
-
-        for opt in topological.sort(
-            [
-                ("PARTITION_BY", "PARTITIONS"),
-                ("PARTITION_BY", "SUBPARTITION_BY"),
-                ("PARTITION_BY", "SUBPARTITIONS"),
-                ("PARTITIONS", "SUBPARTITIONS"),
-                ("PARTITIONS", "SUBPARTITION_BY"),
-                ("SUBPARTITION_BY", "SUBPARTITIONS"),
-            ],
-            part_options,
-        ):
-            arg = opts[opt]
-            if opt in _reflection._options_of_type_string:
-                arg = self.sql_compiler.render_literal_value(
-                    arg, sqltypes.String()
-                )
+        def _render_nonpart(opt):
+            arg = _render_arg(opt)
+            rendered = _TABLE_OPTION_RENDER.get(opt)
+            if rendered is None:
+                table_opts.append("=".join((opt, arg)))
+            else:
+                name, joiner = rendered
+                table_opts.append(joiner.join((name, arg)))
+
+        # non-partition options render in the order given, except that
+        # COLLATE must follow any CHARSET / CHARACTER SET option and so
+        # is deferred to the end; this replaces a per-CREATE
+        # topological sort over a constant dependency graph
+        for opt in opts:
+            if opt in _PARTITION_OPTIONS or opt == "COLLATE":
+                continue
+            _render_nonpart(opt)
 
-            opt = opt.replace("_", " ")
-            joiner = " "
+        if "COLLATE" in opts:
+            _render_nonpart("COLLATE")
 
-            table_opts.append(joiner.join((opt, arg)))
+        # the partition option order is total, precomputed at module
+        # scope
+        for opt, name in _PARTITION_OPTION_ORDER:
+            if opt in opts:
+                table_opts.append(" ".join((name, _render_arg(opt))))
 
         return " ".join(table_opts)
 
@@ -1948,10 +2070,11 @@ class MySQLDDLCompiler(compiler.DDLCompiler):
         index = create.element
         self._verify_index_table(index)
         preparer = self.preparer
+        process = self.sql_compiler.process
         table = preparer.format_table(index.table)
 
         columns = [
-            self.sql_compiler.process(
+            process(
                 (
                     elements.Grouping(expr)
                     if (
@@ -1986,39 +2109,49 @@ class MySQLDDLCompiler(compiler.DDLCompiler):
             text += "IF NOT EXISTS "
         text += "%s ON %s " % (name, table)
 
-        length = index.dialect_options[self.dialect.name]["length"]
+        # note the asymmetry: length honors the compiling dialect's
+        # name (mysql or mariadb) while with_parser / using read the
+        # "mysql" option group only
+        mysql_opts = index.dialect_options["mysql"]
+        if self.dialect.name == "mysql":
+            length = mysql_opts["length"]
+        else:
+            length = index.dialect_options[self.dialect.name]["length"]
+
         if length is not None:
             if isinstance(length, dict):
                 # length value can be a (column_name --> integer value)
                 # mapping specifying the prefix length for each column of the
-                # index
+                # index; a lookup by column name takes precedence over the
+                # rendered expression
+                def _fmt(col, expr):
+                    col_length = length.get(col.name, length.get(expr))
+                    if col_length is not None:
+                        return "%s(%d)" % (expr, col_length)
+                    else:
+                        return expr
+
                 columns = ", ".join(
-                    (
-                        "%s(%d)" % (expr, length[col.name])
-                        if col.name in length
-                        else (
-                            "%s(%d)" % (expr, length[expr])
-                            if expr in length
-                            else "%s" % expr
-                        )
-                    )
-                    for col, expr in zip(index.expressions, columns)
+                    [
+                        _fmt(col, expr)
+                        for col, expr in zip(index.expressions, columns)
+                    ]
                 )
             else:
                 # or can be an integer value specifying the same
                 # prefix length for all columns of the index
                 columns = ", ".join(
-                    "%s(%d)" % (col, length) for col in columns
+                    ["%s(%d)" % (col, length) for col in columns]
                 )
         else:
             columns = ", ".join(columns)
         text += "(%s)" % columns
 
-        parser = index.dialect_options["mysql"]["with_parser"]
+        parser = mysql_opts["with_parser"]
         if parser is not None:
             text += " WITH PARSER %s" % (parser,)
 
-        using = index.dialect_options["mysql"]["using"]
+        using = mysql_opts["using"]
         if using is not None:
             text += " USING %s" % (preparer.quote(using))
 
@@ -2044,24 +2177,33 @@ class MySQLDDLCompiler(compiler.DDLCompiler):
 
     def visit_drop_constraint(self, drop, **kw):
         constraint = drop.element
-        if isinstance(constraint, sa_schema.ForeignKeyConstraint):
-            qual = "FOREIGN KEY "
-            const = self.preparer.format_constraint(constraint)
+        entry = _DROP_CONSTRAINT_QUAL.get(constraint.__class__)
+        if entry is not None:
+            qual, needs_name = entry
+        # exact-class miss: a constraint subclass, resolved through the
+        # original isinstance chain
+        elif isinstance(constraint, sa_schema.ForeignKeyConstraint):
+            qual, needs_name = "FOREIGN KEY ", True
         elif isinstance(constraint, sa_schema.PrimaryKeyConstraint):
-            qual = "PRIMARY KEY "
-            const = ""
+            qual, needs_name = "PRIMARY KEY ", False
         elif isinstance(constraint, sa_schema.UniqueConstraint):
-            qual = "INDEX "
-            const = self.preparer.format_constraint(constraint)
+            qual, needs_name = "INDEX ", True
         elif isinstance(constraint, sa_schema.CheckConstraint):
+            qual, needs_name = None, True
+        else:
+            qual, needs_name = "", True
+
+        if qual is None:
+            # CHECK constraints: MariaDB drops by constraint name
             if self.dialect.is_mariadb:
                 qual = "CONSTRAINT "
             else:
                 qual = "CHECK "
+
+        if needs_name:
             const = self.preparer.format_constraint(constraint)
         else:
-            qual = ""
-            const = self.preparer.format_constraint(constraint)
+            const = ""
         return "ALTER TABLE %s DROP %s%s" % (
             self.preparer.format_table(constraint.table),
             qual,
@@ -2101,7 +2243,7 @@ class MySQLTypeCompiler(compiler.GenericTypeCompiler):
     def _extend_numeric(self, type_, spec):
         "Extend a numeric-type declaration with MySQL specific extensions."
 
-        if not self._mysql_type(type_):
+        if not isinstance(type_, _NumericType):
             return spec
 
         if type_.unsigned:
@@ -2116,26 +2258,27 @@ class MySQLTypeCompiler(compiler.GenericTypeCompiler):
 
         """
 
-        def attr(name):
-            return getattr(type_, name, defaults.get(name))
+        get = defaults.get
 
-        if attr("charset"):
-            charset = "CHARACTER SET %s" % attr("charset")
-        elif attr("ascii"):
+        charset = getattr(type_, "charset", get("charset"))
+        if charset:
+            charset = "CHARACTER SET %s" % charset
+        elif getattr(type_, "ascii", get("ascii")):
             charset = "ASCII"
-        elif attr("unicode"):
+        elif getattr(type_, "unicode", get("unicode")):
             charset = "UNICODE"
         else:
             charset = None
 
-        if attr("collation"):
-            collation = "COLLATE %s" % type_.collation
-        elif attr("binary"):
+        collation = getattr(type_, "collation", get("collation"))
+        if collation:
+            collation = "COLLATE %s" % collation
+        elif getattr(type_, "binary", get("binary")):
             collation = "BINARY"
         else:
             collation = None
 
-        if attr("national"):
+        if getattr(type_, "national", get("national")):
             # NATIONAL (aka NCHAR/NVARCHAR) trumps charsets.
             return " ".join(
                 [c for c in ("NATIONAL", spec, collation) if c is not None]
@@ -2144,9 +2287,6 @@ class MySQLTypeCompiler(compiler.GenericTypeCompiler):
             [c for c in (spec, charset, collation) if c is not None]
         )
 
-    def _mysql_type(self, type_):
-        return isinstance(type_, (_StringType, _NumericType))
-
     def visit_NUMERIC(self, type_, **kw):
         if type_.precision is None:
             return self._extend_numeric(type_, "NUMERIC")
@@ -2199,7 +2339,7 @@ class MySQLTypeCompiler(compiler.GenericTypeCompiler):
 
     def visit_FLOAT(self, type_, **kw):
         if (
-            self._mysql_type(type_)
+            isinstance(type_, _NumericType)
             and type_.scale is not None
             and type_.precision is not None
         ):
@@ -2214,7 +2354,10 @@ class MySQLTypeCompiler(compiler.GenericTypeCompiler):
             return self._extend_numeric(type_, "FLOAT")
 
     def visit_INTEGER(self, type_, **kw):
-        if self._mysql_type(type_) and type_.display_width is not None:
+        if (
+            isinstance(type_, _NumericType)
+            and type_.display_width is not None
+        ):
             return self._extend_numeric(
                 type_,
                 "INTEGER(%(display_width)s)"
@@ -2224,7 +2367,10 @@ class MySQLTypeCompiler(compiler.GenericTypeCompiler):
             return self._extend_numeric(type_, "INTEGER")
 
     def visit_BIGINT(self, type_, **kw):
-        if self._mysql_type(type_) and type_.display_width is not None:
+        if (
+            isinstance(type_, _NumericType)
+            and type_.display_width is not None
+        ):
             return self._extend_numeric(
                 type_,
                 "BIGINT(%(display_width)s)"
@@ -2234,7 +2380,10 @@ class MySQLTypeCompiler(compiler.GenericTypeCompiler):
             return self._extend_numeric(type_, "BIGINT")
 
     def visit_MEDIUMINT(self, type_, **kw):
-        if self._mysql_type(type_) and type_.display_width is not None:
+        if (
+            isinstance(type_, _NumericType)
+            and type_.display_width is not None
+        ):
             return self._extend_numeric(
                 type_,
                 "MEDIUMINT(%(display_width)s)"
@@ -2244,7 +2393,10 @@ class MySQLTypeCompiler(compiler.GenericTypeCompiler):
             return self._extend_numeric(type_, "MEDIUMINT")
 
     def visit_TINYINT(self, type_, **kw):
-        if self._mysql_type(type_) and type_.display_width is not None:
+        if (
+            isinstance(type_, _NumericType)
+            and type_.display_width is not None
+        ):
             return self._extend_numeric(
                 type_, "TINYINT(%s)" % type_.display_width
             )
@@ -2252,7 +2404,10 @@ class MySQLTypeCompiler(compiler.GenericTypeCompiler):
             return self._extend_numeric(type_, "TINYINT")
 
     def visit_SMALLINT(self, type_, **kw):
-        if self._mysql_type(type_) and type_.display_width is not None:
+        if (
+            isinstance(type_, _NumericType)
+            and type_.display_width is not None
+        ):
             return self._extend_numeric(
                 type_,
                 "SMALLINT(%(display_width)s)"
@@ -2268,8 +2423,9 @@ class MySQLTypeCompiler(compiler.GenericTypeCompiler):
             return "BIT"
 
     def visit_DATETIME(self, type_, **kw):
-        if getattr(type_, "fsp", None):
-            return "DATETIME(%d)" % type_.fsp
+        fsp = getattr(type_, "fsp", None)
+        if fsp:
+            return "DATETIME(%d)" % fsp
         else:
             return "DATETIME"
 
@@ -2277,14 +2433,16 @@ class MySQLTypeCompiler(compiler.GenericTypeCompiler):
         return "DATE"
 
     def visit_TIME(self, type_, **kw):
-        if getattr(type_, "fsp", None):
-            return "TIME(%d)" % type_.fsp
+        fsp = getattr(type_, "fsp", None)
+        if fsp:
+            return "TIME(%d)" % fsp
         else:
             return "TIME"
 
     def visit_TIMESTAMP(self, type_, **kw):
-        if getattr(type_, "fsp", None):
-            return "TIMESTAMP(%d)" % type_.fsp
+        fsp = getattr(type_, "fsp", None)
+        if fsp:
+            return "TIMESTAMP(%d)" % fsp
         else:
             return "TIMESTAMP"
 
@@ -2384,15 +2542,31 @@ class MySQLTypeCompiler(compiler.GenericTypeCompiler):
     def visit_LONGBLOB(self, type_, **kw):
         return "LONGBLOB"
 
+    @util.memoized_property
+    def _enum_value_cache(self):
+        """escaped ENUM / SET value lists, keyed by the values
+        themselves; see :meth:`._visit_enumerated_values`."""
+        return util.LRUCache(200)
+
     def _visit_enumerated_values(self, name, type_, enumerated_values):
-        quoted_enums = []
-        for e in enumerated_values:
-            if self.dialect.identifier_preparer._double_percents:
-                e = e.replace("%", "%%")
-            quoted_enums.append("'%s'" % e.replace("'", "''"))
-        return self._extend_string(
-            type_, {}, "%s(%s)" % (name, ",".join(quoted_enums))
-        )
+        # the escaped value list is a pure function of the values and
+        # the paramstyle's percent doubling, so memoize it by value;
+        # reflecting many ENUM columns revisits the same lists
+        double_percents = self.dialect.identifier_preparer._double_percents
+        key = (name, tuple(enumerated_values), double_percents)
+        cache = self._enum_value_cache
+        try:
+            spec = cache[key]
+        except KeyError:
+            quoted_enums = []
+            for e in enumerated_values:
+                if double_percents and "%" in e:
+                    e = e.replace("%", "%%")
+                if "'" in e:
+                    e = e.replace("'", "''")
+                quoted_enums.append("'%s'" % e)
+            spec = cache[key] = "%s(%s)" % (name, ",".join(quoted_enums))
+        return self._extend_string(type_, {}, spec)
 
     def visit_ENUM(self, type_, **kw):
         return self._visit_enumerated_values("ENUM", type_, type_.enums)
@@ -2418,13 +2592,41 @@ class MySQLIdentifierPreparer(compiler.IdentifierPreparer):
     def _quote_free_identifiers(self, *ids):
         """Unilaterally identifier-quote any number of strings."""
 
-        return tuple([self.quote_identifier(i) for i in ids if i is not None])
+        quote_identifier = self.quote_identifier
+        return tuple(
+            quote_identifier(i) for i in ids if i is not None
+        )
 
 
 class MariaDBIdentifierPreparer(MySQLIdentifierPreparer):
     reserved_words = RESERVED_WORDS_MARIADB
 
 
+# constructed once; text() constructs are stateless until compiled, so
+# per-call construction in has_sequence / get_sequence_names was pure
+# overhead
+_has_sequence_query = sql.text(
+    "SELECT 1 FROM INFORMATION_SCHEMA.TABLES "
+    "WHERE TABLE_TYPE='SEQUENCE' and TABLE_NAME=:name AND "
+    "TABLE_SCHEMA=:schema_name LIMIT 1"
+)
+
+_sequence_names_query = sql.text(
+    "SELECT TABLE_NAME FROM INFORMATION_SCHEMA.TABLES "
+    "WHERE TABLE_TYPE='SEQUENCE' and TABLE_SCHEMA=:schema_name"
+)
+
+# process-wide MySQLTableDefinitionParser instances, keyed by dialect
+# class and preparer quoting; see MySQLDialect._tabledef_parser
+_tabledef_parser_cache = {}
+
+# server/client error codes that indicate a dead connection; see
+# MySQLDialect.is_disconnect
+_DISCONNECT_ERROR_CODES = frozenset(
+    {1927, 2006, 2013, 2014, 2045, 2055, 4031}
+)
+
+
 @log.class_logger
 class MySQLDialect(default.DefaultDialect):
     """Details of the MySQL dialect.
@@ -2527,26 +2729,41 @@ class MySQLDialect(default.DefaultDialect):
         self._json_deserializer = json_deserializer
         self._set_mariadb(is_mariadb, None)
 
+    _isolation_levels = (
+        "SERIALIZABLE",
+        "READ UNCOMMITTED",
+        "READ COMMITTED",
+        "REPEATABLE READ",
+    )
+
+    # levels are validated against get_isolation_level_values() before
+    # set_isolation_level() is called, so the SET statements can be
+    # staged up front
+    _isolation_level_sql = {
+        level: "SET SESSION TRANSACTION ISOLATION LEVEL " + level
+        for level in _isolation_levels
+    }
+
     def get_isolation_level_values(self, dbapi_conn):
-        return (
-            "SERIALIZABLE",
-            "READ UNCOMMITTED",
-            "READ COMMITTED",
-            "REPEATABLE READ",
-        )
+        return self._isolation_levels
 
     def set_isolation_level(self, dbapi_connection, level):
         cursor = dbapi_connection.cursor()
-        cursor.execute(f"SET SESSION TRANSACTION ISOLATION LEVEL {level}")
+        cursor.execute(self._isolation_level_sql[level])
         cursor.execute("COMMIT")
         cursor.close()
 
-    def get_isolation_level(self, dbapi_connection):
-        cursor = dbapi_connection.cursor()
+    @util.memoized_property
+    def _get_isolation_level_stmt(self):
+        # server_version_info is fixed once the dialect has connected
         if self._is_mysql and self.server_version_info >= (5, 7, 20):
-            cursor.execute("SELECT @@transaction_isolation")
+            return "SELECT @@transaction_isolation"
         else:
-            cursor.execute("SELECT @@tx_isolation")
+            return "SELECT @@tx_isolation"
+
+    def get_isolation_level(self, dbapi_connection):
+        cursor = dbapi_connection.cursor()
+        cursor.execute(self._get_isolation_level_stmt)
         row = cursor.fetchone()
         if row is None:
             util.warn(
@@ -2560,8 +2777,18 @@ class MySQLDialect(default.DefaultDialect):
             val = val.decode()
         return val.upper().replace("-", " ")
 
+    # memoizes the MariaDB probe per URL so repeated create_engine()
+    # calls against the same server skip the extra connect entirely
+    _is_mariadb_url_cache = {}
+
     @classmethod
     def _is_mariadb_from_url(cls, url):
+        key = url.render_as_string(hide_password=True)
+        try:
+            return cls._is_mariadb_url_cache[key]
+        except KeyError:
+            pass
+
         dbapi = cls.import_dbapi()
         dialect = cls(dbapi=dbapi)
 
@@ -2569,12 +2796,19 @@ class MySQLDialect(default.DefaultDialect):
         conn = dialect.connect(*cargs, **cparams)
         try:
             cursor = conn.cursor()
-            cursor.execute("SELECT VERSION() LIKE '%MariaDB%'")
+            cursor.execute("SELECT VERSION()")
             val = cursor.fetchone()[0]
         except:
             raise
         else:
-            return bool(val)
+            if isinstance(val, bytes):
+                val = val.decode()
+            # same case-insensitive match as the previous
+            # "SELECT VERSION() LIKE '%MariaDB%'" probe, without
+            # pushing the comparison to the server
+            is_mariadb = "mariadb" in val.lower()
+            cls._is_mariadb_url_cache[key] = is_mariadb
+            return is_mariadb
         finally:
             conn.close()
 
@@ -2596,12 +2830,15 @@ class MySQLDialect(default.DefaultDialect):
         version = []
         is_mariadb = False
 
-        r = re.compile(r"[.\-+]")
-        tokens = r.split(val)
+        tokens = _server_version_delimiter_re.split(val)
         for token in tokens:
-            parsed_token = re.match(
-                r"^(?:(\d+)(?:a|b|c)?|(MariaDB\w*))$", token
-            )
+            # nearly every token is a plain digit run; skip the regex
+            # for those.  isdecimal() exactly implies a group-1 match
+            # below (isdigit() would also pass characters int() rejects)
+            if token.isdecimal():
+                version.append(int(token))
+                continue
+            parsed_token = _server_version_token_re.match(token)
             if not parsed_token:
                 continue
             elif parsed_token.group(2):
@@ -2674,25 +2911,23 @@ class MySQLDialect(default.DefaultDialect):
         connection.execute(sql.text("XA COMMIT :xid"), dict(xid=xid))
 
     def do_recover_twophase(self, connection):
+        # XA RECOVER columns are fixed as (formatID, gtrid_length,
+        # bqual_length, data); positional access skips the per-row
+        # mapping lookups of the string keys
         resultset = connection.exec_driver_sql("XA RECOVER")
-        return [row["data"][0 : row["gtrid_length"]] for row in resultset]
+        return [row[3][0 : row[1]] for row in resultset]
 
     def is_disconnect(self, e, connection, cursor):
-        if isinstance(
-            e,
-            (
-                self.dbapi.OperationalError,
-                self.dbapi.ProgrammingError,
-                self.dbapi.InterfaceError,
-            ),
-        ) and self._extract_error_code(e) in (
-            1927,
-            2006,
-            2013,
-            2014,
-            2045,
-            2055,
-            4031,
+        if (
+            isinstance(
+                e,
+                (
+                    self.dbapi.OperationalError,
+                    self.dbapi.ProgrammingError,
+                    self.dbapi.InterfaceError,
+                ),
+            )
+            and self._extract_error_code(e) in _DISCONNECT_ERROR_CODES
         ):
             return True
         elif isinstance(
@@ -2700,6 +2935,10 @@ class MySQLDialect(default.DefaultDialect):
         ):
             # if underlying connection is closed,
             # this is the error you get
+            if e.args[:2] == (0, ""):
+                return True
+            # fall back to scanning the message for drivers that wrap
+            # the original (0, '') args into a formatted string
             return "(0, '')" in str(e)
         else:
             return False
@@ -2708,27 +2947,31 @@ class MySQLDialect(default.DefaultDialect):
         """Proxy result rows to smooth over MySQL-Python driver
         inconsistencies."""
 
-        return [_DecodingRow(row, charset) for row in rp.fetchall()]
+        charset = _DecodingRow._resolve_charset(charset)
+        return [
+            _DecodingRow(row, charset) if _row_needs_decoding(row) else row
+            for row in rp.fetchall()
+        ]
 
     def _compat_fetchone(self, rp, charset=None):
         """Proxy a result row to smooth over MySQL-Python driver
         inconsistencies."""
 
         row = rp.fetchone()
-        if row:
-            return _DecodingRow(row, charset)
+        if row and _row_needs_decoding(row):
+            return _DecodingRow(row, _DecodingRow._resolve_charset(charset))
         else:
-            return None
+            return row or None
 
     def _compat_first(self, rp, charset=None):
         """Proxy a result row to smooth over MySQL-Python driver
         inconsistencies."""
 
         row = rp.first()
-        if row:
-            return _DecodingRow(row, charset)
+        if row and _row_needs_decoding(row):
+            return _DecodingRow(row, _DecodingRow._resolve_charset(charset))
         else:
-            return None
+            return row or None
 
     def _extract_error_code(self, exception):
         raise NotImplementedError()
@@ -2791,11 +3034,7 @@ class MySQLDialect(default.DefaultDialect):
         # MariaDB implements sequences as a special type of table
         #
         cursor = connection.execute(
-            sql.text(
-                "SELECT TABLE_NAME FROM INFORMATION_SCHEMA.TABLES "
-                "WHERE TABLE_TYPE='SEQUENCE' and TABLE_NAME=:name AND "
-                "TABLE_SCHEMA=:schema_name"
-            ),
+            _has_sequence_query,
             dict(
                 name=str(sequence_name),
                 schema_name=str(schema),
@@ -2817,10 +3056,7 @@ class MySQLDialect(default.DefaultDialect):
             schema = self.default_schema_name
         # MariaDB implements sequences as a special type of table
         cursor = connection.execute(
-            sql.text(
-                "SELECT TABLE_NAME FROM INFORMATION_SCHEMA.TABLES "
-                "WHERE TABLE_TYPE='SEQUENCE' and TABLE_SCHEMA=:schema_name"
-            ),
+            _sequence_names_query,
             dict(schema_name=schema),
         )
         return [
@@ -2841,9 +3077,13 @@ class MySQLDialect(default.DefaultDialect):
         # SQL gets compiled within initialize() currently
         default.DefaultDialect.initialize(self, connection)
 
-        self._detect_sql_mode(connection)
+        # one round trip for both settings where the server allows it
+        sql_mode, casing = self._fetch_settings(
+            connection, ("sql_mode", "lower_case_table_names")
+        )
+        self._set_sql_mode(sql_mode)
         self._detect_ansiquotes(connection)  # depends on sql mode
-        self._detect_casing(connection)
+        self._set_casing(casing)
         if self._server_ansiquotes:
             # if ansiquotes == True, build a new IdentifierPreparer
             # with the new setting
@@ -2934,40 +3174,44 @@ class MySQLDialect(default.DefaultDialect):
         return [r[0] for r in rp]
 
     @reflection.cache
-    def get_table_names(self, connection, schema=None, **kw):
-        """Return a Unicode SHOW TABLES from a given schema."""
-        if schema is not None:
-            current_schema = schema
-        else:
-            current_schema = self.default_schema_name
+    def _get_full_table_names(self, connection, schema=None, **kw):
+        """return ``(table_names, view_names)`` for a schema from a
+        single SHOW FULL TABLES pass.
+
+        typical Inspector usage asks for both lists; sharing one cached
+        result halves the round trips.
 
+        """
         charset = self._connection_charset
 
         rp = connection.exec_driver_sql(
             "SHOW FULL TABLES FROM %s"
-            % self.identifier_preparer.quote_identifier(current_schema)
+            % self.identifier_preparer.quote_identifier(schema)
         )
 
-        return [
-            row[0]
-            for row in self._compat_fetchall(rp, charset=charset)
-            if row[1] == "BASE TABLE"
-        ]
+        tables = []
+        views = []
+        for row in self._compat_fetchall(rp, charset=charset):
+            if row[1] == "BASE TABLE":
+                tables.append(row[0])
+            elif row[1] in ("VIEW", "SYSTEM VIEW"):
+                views.append(row[0])
+        return tables, views
+
+    def get_table_names(self, connection, schema=None, **kw):
+        """Return a Unicode SHOW TABLES from a given schema."""
+        if schema is None:
+            schema = self.default_schema_name
+        return self._get_full_table_names(
+            connection, schema, info_cache=kw.get("info_cache")
+        )[0]
 
-    @reflection.cache
     def get_view_names(self, connection, schema=None, **kw):
         if schema is None:
             schema = self.default_schema_name
-        charset = self._connection_charset
-        rp = connection.exec_driver_sql(
-            "SHOW FULL TABLES FROM %s"
-            % self.identifier_preparer.quote_identifier(schema)
-        )
-        return [
-            row[0]
-            for row in self._compat_fetchall(rp, charset=charset)
-            if row[1] in ("VIEW", "SYSTEM VIEW")
-        ]
+        return self._get_full_table_names(
+            connection, schema, info_cache=kw.get("info_cache")
+        )[1]
 
     @reflection.cache
     def get_table_options(self, connection, table_name, schema=None, **kw):
@@ -3003,6 +3247,46 @@ class MySQLDialect(default.DefaultDialect):
 
     @reflection.cache
     def get_foreign_keys(self, connection, table_name, schema=None, **kw):
+        fkeys = self._get_raw_foreign_keys(
+            connection, table_name, schema, **kw
+        )
+
+        if self._needs_correct_for_88718_96365:
+            self._correct_for_mysql_bugs_88718_96365(fkeys, connection)
+
+        return fkeys if fkeys else ReflectionDefaults.foreign_keys()
+
+    def get_multi_foreign_keys(self, connection, **kw):
+        """batched form of foreign key reflection.
+
+        tables are parsed one at a time as for the single-table case,
+        however the MySQL 8 casing correction, which requires an
+        information_schema query, is applied once for the whole batch
+        rather than once per table.
+
+        """
+        result = list(
+            self._default_multi_reflect(
+                self._get_raw_foreign_keys, connection, **kw
+            )
+        )
+
+        if self._needs_correct_for_88718_96365:
+            all_fkeys = [fkey for _, fkeys in result for fkey in fkeys]
+            if all_fkeys:
+                self._correct_for_mysql_bugs_88718_96365(
+                    all_fkeys, connection
+                )
+
+        return (
+            (key, fkeys if fkeys else ReflectionDefaults.foreign_keys())
+            for key, fkeys in result
+        )
+
+    def _get_raw_foreign_keys(self, connection, table_name, schema=None, **kw):
+        """return foreign key records for a table without the MySQL 8
+        casing correction or defaults applied."""
+
         parsed_state = self._parsed_state_or_create(
             connection, table_name, schema, **kw
         )
@@ -3038,10 +3322,7 @@ class MySQLDialect(default.DefaultDialect):
             }
             fkeys.append(fkey_d)
 
-        if self._needs_correct_for_88718_96365:
-            self._correct_for_mysql_bugs_88718_96365(fkeys, connection)
-
-        return fkeys if fkeys else ReflectionDefaults.foreign_keys()
+        return fkeys
 
     def _correct_for_mysql_bugs_88718_96365(self, fkeys, connection):
         # Foreign key is always in lower case (MySQL 8.0)
@@ -3074,32 +3355,24 @@ class MySQLDialect(default.DefaultDialect):
         # NOTE: using (table_schema, table_name, lower(column_name)) in (...)
         # is very slow since mysql does not seem able to properly use indexse.
         # Unpack the where condition instead.
-        schema_by_table_by_column = defaultdict(lambda: defaultdict(list))
+        tables_by_schema = defaultdict(set)
         for rec in fkeys:
             sch = lower(rec["referred_schema"] or default_schema_name)
             tbl = lower(rec["referred_table"])
-            for col_name in rec["referred_columns"]:
-                schema_by_table_by_column[sch][tbl].append(col_name)
-
-        if schema_by_table_by_column:
+            tables_by_schema[sch].add(tbl)
 
+        if tables_by_schema:
+            # filter on (table_schema, table_name) only, matching the
+            # information_schema.columns primary key prefix; the
+            # lower(column_name) comparison happens client-side below,
+            # where every fetched column lands in the lookup dict anyway
             condition = sql.or_(
                 *(
                     sql.and_(
                         _info_columns.c.table_schema == schema,
-                        sql.or_(
-                            *(
-                                sql.and_(
-                                    _info_columns.c.table_name == table,
-                                    sql.func.lower(
-                                        _info_columns.c.column_name
-                                    ).in_(columns),
-                                )
-                                for table, columns in tables.items()
-                            )
-                        ),
+                        _info_columns.c.table_name.in_(sorted(tables)),
                     )
-                    for schema, tables in schema_by_table_by_column.items()
+                    for schema, tables in tables_by_schema.items()
                 )
             )
 
@@ -3109,7 +3382,16 @@ class MySQLDialect(default.DefaultDialect):
                 _info_columns.c.column_name,
             ).where(condition)
 
-            correct_for_wrong_fk_case = connection.execute(select)
+            # with batched multi-table reflection this scan can cover
+            # many tables; stream it rather than buffering the full
+            # result, as rows are consumed one at a time below.  the
+            # options go on the statement - Connection.execution_options
+            # modifies the caller's connection in place
+            correct_for_wrong_fk_case = connection.execute(
+                select.execution_options(
+                    stream_results=True, max_row_buffer=1000
+                )
+            )
 
             # in casing=0, table name and schema name come back in their
             # exact case.
@@ -3123,9 +3405,10 @@ class MySQLDialect(default.DefaultDialect):
             # is necessary
             d = defaultdict(dict)
             for schema, tname, cname in correct_for_wrong_fk_case:
-                d[(lower(schema), lower(tname))]["SCHEMANAME"] = schema
-                d[(lower(schema), lower(tname))]["TABLENAME"] = tname
-                d[(lower(schema), lower(tname))][cname.lower()] = cname
+                rec = d[(lower(schema), lower(tname))]
+                rec["SCHEMANAME"] = schema
+                rec["TABLENAME"] = tname
+                rec[cname.lower()] = cname
 
             for fkey in fkeys:
                 rec = d[
@@ -3266,6 +3549,46 @@ class MySQLDialect(default.DefaultDialect):
             info_cache=kw.get("info_cache", None),
         )
 
+    # optional dict surviving across Inspector instances; None means
+    # the cross-call cache is disabled
+    _cross_call_reflection_cache = None
+
+    @contextlib.contextmanager
+    def _persistent_reflection_cache(self):
+        """enable a reflection cache that survives across separate
+        :class:`_reflection.Inspector` instances on this dialect.
+
+        ordinarily each inspector carries its own ``info_cache``, so
+        tools that re-inspect repeatedly (e.g. an autogenerate run)
+        re-fetch table definitions each time.  within this block,
+        parsed table state is retained on the dialect keyed by
+        ``(schema, table, server_version)``; the caller asserts that
+        schema DDL does not change for the duration.
+
+        """
+        if self._cross_call_reflection_cache is not None:
+            # nested use; keep the outermost cache
+            yield
+            return
+        self._cross_call_reflection_cache = {}
+        try:
+            yield
+        finally:
+            self._cross_call_reflection_cache = None
+
+    def _cached_reflection(self, key, fn):
+        """check the cross-call cache for key, else call fn() and
+        store its result if the cache is enabled."""
+
+        cache = self._cross_call_reflection_cache
+        if cache is None:
+            return fn()
+        try:
+            return cache[key]
+        except KeyError:
+            cache[key] = result = fn()
+            return result
+
     @util.memoized_property
     def _tabledef_parser(self):
         """return the MySQLTableDefinitionParser, generate if needed.
@@ -3273,12 +3596,53 @@ class MySQLDialect(default.DefaultDialect):
         The deferred creation ensures that the dialect has
         retrieved server version information first.
 
+        Parsers are additionally shared process-wide between dialect
+        instances with equivalent quoting behavior, since the compiled
+        regex set depends only on the dialect class and the preparer's
+        quote characters; repeated engine creation then skips
+        recompiling the several dozen parser regexes.
+
         """
         preparer = self.identifier_preparer
-        return _reflection.MySQLTableDefinitionParser(self, preparer)
+        key = (
+            self.__class__,
+            preparer.__class__,
+            preparer.initial_quote,
+            preparer.final_quote,
+        )
+        try:
+            return _tabledef_parser_cache[key]
+        except KeyError:
+            parser = _tabledef_parser_cache[key] = (
+                _reflection.MySQLTableDefinitionParser(self, preparer)
+            )
+            return parser
 
     @reflection.cache
     def _setup_parser(self, connection, table_name, schema=None, **kw):
+        return self._cached_reflection(
+            ("parsed_state", schema, table_name, self.server_version_info),
+            lambda: self._setup_parser_impl(connection, table_name, schema),
+        )
+
+    @util.memoized_property
+    def _show_create_parse_cache(self):
+        return util.LRUCache(1024)
+
+    @util.memoized_property
+    def _typeclause_cast_cache(self):
+        """rendered CAST type strings, keyed per type instance; see
+        :meth:`.MySQLCompiler.visit_typeclause`."""
+        return util.LRUCache(200)
+
+    @util.memoized_property
+    def _odku_col_cache(self):
+        """reordered column lists for ON DUPLICATE KEY UPDATE, keyed
+        per (table, parameter ordering); see
+        :meth:`.MySQLCompiler.visit_on_duplicate_key_update`."""
+        return util.LRUCache(100)
+
+    def _setup_parser_impl(self, connection, table_name, schema=None):
         charset = self._connection_charset
         parser = self._tabledef_parser
         full_name = ".".join(
@@ -3295,7 +3659,23 @@ class MySQLDialect(default.DefaultDialect):
                 connection, None, charset, full_name=full_name
             )
             sql = parser._describe_to_create(table_name, columns)
-        return parser.parse(sql, charset)
+
+        # re-reflection of an unchanged table skips the regex parse
+        # pipeline; the DDL text still round-trips above, so the key
+        # hash detects any change in the definition
+        key = (
+            schema,
+            table_name,
+            charset,
+            zlib.crc32(sql.encode("utf-8", "backslashreplace")),
+        )
+        try:
+            return self._show_create_parse_cache[key]
+        except KeyError:
+            parsed = self._show_create_parse_cache[key] = parser.parse(
+                sql, charset
+            )
+            return parsed
 
     def _fetch_setting(self, connection, setting_name):
         charset = self._connection_charset
@@ -3314,6 +3694,27 @@ class MySQLDialect(default.DefaultDialect):
         else:
             return row[fetch_col]
 
+    def _fetch_settings(self, connection, setting_names):
+        """Fetch several server settings in a single round trip where
+        the server supports it, returning values in the given order."""
+
+        if self.server_version_info and self.server_version_info < (5, 6):
+            return [
+                self._fetch_setting(connection, setting_name)
+                for setting_name in setting_names
+            ]
+
+        charset = self._connection_charset
+        show_var = connection.exec_driver_sql(
+            "SELECT %s"
+            % ", ".join("@@%s" % name for name in setting_names)
+        )
+        row = self._compat_first(show_var, charset=charset)
+        if not row:
+            return [None] * len(setting_names)
+        else:
+            return list(row)
+
     def _detect_charset(self, connection):
         raise NotImplementedError()
 
@@ -3327,6 +3728,9 @@ class MySQLDialect(default.DefaultDialect):
         # https://dev.mysql.com/doc/refman/en/identifier-case-sensitivity.html
 
         setting = self._fetch_setting(connection, "lower_case_table_names")
+        return self._set_casing(setting)
+
+    def _set_casing(self, setting):
         if setting is None:
             cs = 0
         else:
@@ -3355,8 +3759,9 @@ class MySQLDialect(default.DefaultDialect):
         return collations
 
     def _detect_sql_mode(self, connection):
-        setting = self._fetch_setting(connection, "sql_mode")
+        self._set_sql_mode(self._fetch_setting(connection, "sql_mode"))
 
+    def _set_sql_mode(self, setting):
         if setting is None:
             util.warn(
                 "Could not retrieve SQL_MODE; please ensure the "
@@ -3438,6 +3843,20 @@ class MySQLDialect(default.DefaultDialect):
         return rows
 
 
+def _row_needs_decoding(row):
+    """True if a row has cells that _DecodingRow would translate.
+
+    Modern DBAPIs on Python 3 return ``str`` for textual columns, in
+    which case the wrapper and its per-cell isinstance branching are
+    pure overhead; such rows are passed through unwrapped.
+
+    """
+    for col in row:
+        if isinstance(col, (bytes, _array)):
+            return True
+    return False
+
+
 class _DecodingRow:
     """Return unicode-decoded values based on type inspection.
 
@@ -3451,6 +3870,8 @@ class _DecodingRow:
     # sets.Set(['value']) (seriously) but thankfully that doesn't
     # seem to come up in DDL queries.
 
+    __slots__ = ("rowproxy", "charset")
+
     _encoding_compat = {
         "koi8r": "koi8_r",
         "koi8u": "koi8_u",
@@ -3461,14 +3882,22 @@ class _DecodingRow:
         "eucjpms": "ujis",
     }
 
+    @classmethod
+    def _resolve_charset(cls, charset):
+        """map a MySQL charset name to its Python codec name, once per
+        fetch rather than once per wrapped row."""
+        return cls._encoding_compat.get(charset, charset)
+
     def __init__(self, rowproxy, charset):
+        """``charset`` is a Python codec name already passed through
+        :meth:`._resolve_charset`."""
         self.rowproxy = rowproxy
-        self.charset = self._encoding_compat.get(charset, charset)
+        self.charset = charset
 
     def __getitem__(self, index):
         item = self.rowproxy[index]
         if isinstance(item, _array):
-            item = item.tostring()
+            item = item.tobytes()
 
         if self.charset and isinstance(item, bytes):
             return item.decode(self.charset)
@@ -3478,7 +3907,7 @@ class _DecodingRow:
     def __getattr__(self, attr):
         item = getattr(self.rowproxy, attr)
         if isinstance(item, _array):
-            item = item.tostring()
+            item = item.tobytes()
         if self.charset and isinstance(item, bytes):
             return item.decode(self.charset)
         else:
@@ -5,6 +5,8 @@
 # This module is part of SQLAlchemy and is released under
 # the MIT License: https://www.opensource.org/licenses/mit-license.php
 # mypy: ignore-errors
+from functools import lru_cache
+
 from .base import MariaDBIdentifierPreparer
 from .base import MySQLDialect
 from ... import util
@@ -59,7 +61,11 @@ class MariaDBDialect(MySQLDialect):
         )
 
 
+@lru_cache(maxsize=None)
 def loader(driver):
+    # memoized both for speed and so that the synthesized
+    # MariaDBDialect_<driver> class is a stable identity per driver,
+    # rather than a fresh type() product on every resolution
     dialect_mod = __import__(
         "sqlalchemy.dialects.mysql.%s" % driver
     ).dialects.mysql
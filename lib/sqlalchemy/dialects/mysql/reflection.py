@@ -75,6 +75,10 @@ class MySQLTableDefinitionParser:
         return state
 
     def _check_view(self, sql: str) -> bool:
+        # common case first: plain table DDL is rejected without
+        # entering the regex engine
+        if sql.startswith("CREATE TABLE"):
+            return False
         return bool(self._re_is_view.match(sql))
 
     def _parse_constraints(self, line):
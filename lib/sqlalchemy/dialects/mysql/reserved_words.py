@@ -13,7 +13,7 @@
 # excludes: Exceptions, Function Names
 # mypy: ignore-errors
 
-RESERVED_WORDS_MARIADB = {
+RESERVED_WORDS_MARIADB = frozenset({
     "accessible",
     "add",
     "all",
@@ -280,7 +280,7 @@ RESERVED_WORDS_MARIADB = {
         "versioning",
         "without",
     }
-)
+))
 
 # https://dev.mysql.com/doc/refman/8.3/en/keywords.html
 # https://dev.mysql.com/doc/refman/8.0/en/keywords.html
@@ -289,7 +289,7 @@ RESERVED_WORDS_MARIADB = {
 # includes: MySQL x.0 Keywords and Reserved Words
 # excludes: MySQL x.0 New Keywords and Reserved Words,
 #       MySQL x.0 Removed Keywords and Reserved Words
-RESERVED_WORDS_MYSQL = {
+RESERVED_WORDS_MYSQL = frozenset({
     "accessible",
     "add",
     "admin",
@@ -568,4 +568,4 @@ RESERVED_WORDS_MYSQL = {
     "xor",
     "year_month",
     "zerofill",
-}
+})
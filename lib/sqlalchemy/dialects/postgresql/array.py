@@ -26,6 +26,10 @@ from ...sql._typing import _TypeEngineArgument
 
 _T = TypeVar("_T", bound=Any)
 
+# array-literal parsing for native enum result values; compiled once
+# rather than per processor call
+_ARRAY_BRACES_RE = re.compile(r"^{(.*)}$")
+
 
 def Any(other, arrexpr, operator=operators.eq):
     """A synonym for the ARRAY-level :meth:`.ARRAY.Comparator.any` method.
@@ -104,12 +108,10 @@ class array(expression.ExpressionClauseList[_T]):
         type_arg = kw.pop("type_", None)
         super().__init__(operators.comma_op, *clauses, **kw)
 
-        self._type_tuple = [arg.type for arg in self.clauses]
-
         main_type = (
             type_arg
             if type_arg is not None
-            else self._type_tuple[0] if self._type_tuple else sqltypes.NULLTYPE
+            else self.clauses[0].type if self.clauses else sqltypes.NULLTYPE
         )
 
         if isinstance(main_type, ARRAY):
@@ -140,10 +142,20 @@ class array(expression.ExpressionClauseList[_T]):
             )
 
         else:
+            # each element takes the scalar branch above; build the
+            # BindParameter directly with the loop invariants hoisted
+            # rather than re-entering this method per element
+            BindParameter = expression.BindParameter
+            compared_to_type = self.type
             return array(
                 [
-                    self._bind_param(
-                        operator, o, _assume_scalar=True, type_=type_
+                    BindParameter(
+                        None,
+                        o,
+                        _compared_to_operator=operator,
+                        type_=type_,
+                        _compared_to_type=compared_to_type,
+                        unique=True,
                     )
                     for o in obj
                 ]
@@ -339,26 +351,20 @@ class ARRAY(sqltypes.ARRAY):
         def to_str(elements):
             return f"ARRAY[{', '.join(elements)}]"
 
-        def process(value):
-            inner = self._apply_item_processor(
-                value, item_proc, self.dimensions, to_str
-            )
-            return inner
-
-        return process
+        return self._item_processor_applier(item_proc, to_str)
 
     def bind_processor(self, dialect):
         item_proc = self.item_type.dialect_impl(dialect).bind_processor(
             dialect
         )
 
+        apply_ = self._item_processor_applier(item_proc, list)
+
         def process(value):
             if value is None:
                 return value
             else:
-                return self._apply_item_processor(
-                    value, item_proc, self.dimensions, list
-                )
+                return apply_(value)
 
         return process
 
@@ -367,23 +373,21 @@ class ARRAY(sqltypes.ARRAY):
             dialect, coltype
         )
 
+        apply_ = self._item_processor_applier(
+            item_proc, tuple if self.as_tuple else list
+        )
+
         def process(value):
             if value is None:
                 return value
             else:
-                return self._apply_item_processor(
-                    value,
-                    item_proc,
-                    self.dimensions,
-                    tuple if self.as_tuple else list,
-                )
+                return apply_(value)
 
         if self._against_native_enum:
             super_rp = process
-            pattern = re.compile(r"^{(.*)}$")
 
             def handle_raw_string(value):
-                inner = pattern.match(value).group(1)
+                inner = _ARRAY_BRACES_RE.match(value).group(1)
                 return _split_enum_values(inner)
 
             def process(value):
@@ -410,16 +414,35 @@ def _split_enum_values(array_string):
     # r'abc,"quoted","also\\\\quoted", "quoted, comma", "esc \" quot", qpr'
     # returns
     # ['abc', 'quoted', 'also\\quoted', 'quoted, comma', 'esc " quot', 'qpr']
-    text = array_string.replace(r"\"", "_$ESC_QUOTE$_")
-    text = text.replace(r"\\", "\\")
+    #
+    # single left-to-right scan; the previous implementation made
+    # multiple whole-string replace and regex passes with a sentinel
+    # substitution for escaped quotes
     result = []
-    on_quotes = re.split(r'(")', text)
+    buf = []
     in_quotes = False
-    for tok in on_quotes:
-        if tok == '"':
+    i = 0
+    n = len(array_string)
+    while i < n:
+        ch = array_string[i]
+        if ch == "\\" and i + 1 < n and array_string[i + 1] in ('"', "\\"):
+            buf.append(array_string[i + 1])
+            i += 2
+        elif ch == '"':
+            if buf or in_quotes:
+                # a quoted token is emitted even when empty
+                result.append("".join(buf))
+                buf = []
             in_quotes = not in_quotes
-        elif in_quotes:
-            result.append(tok.replace("_$ESC_QUOTE$_", '"'))
+            i += 1
+        elif not in_quotes and (ch == "," or ch.isspace()):
+            if buf:
+                result.append("".join(buf))
+                buf = []
+            i += 1
         else:
-            result.extend(re.findall(r"([^\s,]+),?", tok))
+            buf.append(ch)
+            i += 1
+    if buf:
+        result.append("".join(buf))
     return result
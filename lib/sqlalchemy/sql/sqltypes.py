@@ -3106,13 +3106,37 @@ class ARRAY(
         def to_str(elements):
             return f"[{', '.join(elements)}]"
 
-        def process(value):
-            inner = self._apply_item_processor(
-                value, item_proc, self.dimensions, to_str
-            )
-            return inner
+        return self._item_processor_applier(item_proc, to_str)
 
-        return process
+    def _item_processor_applier(self, itemproc, collection_callable):
+        """Return a callable applying ``itemproc`` across an array
+        value, specialized for the declared number of dimensions.
+
+        Built once per processor, so the common declared one-dimensional
+        case pays no per-value dimension dispatch; other configurations
+        fall through to :meth:`._apply_item_processor`.
+
+        """
+        dim = self.dimensions
+        if dim == 1:
+            if itemproc:
+
+                def apply_(arr):
+                    return collection_callable(itemproc(x) for x in arr)
+
+            else:
+
+                def apply_(arr):
+                    return collection_callable(arr)
+
+        else:
+
+            def apply_(arr):
+                return self._apply_item_processor(
+                    arr, itemproc, dim, collection_callable
+                )
+
+        return apply_
 
     def _apply_item_processor(self, arr, itemproc, dim, collection_callable):
         """Helper method that can be used by bind_processor(),
@@ -91,19 +91,26 @@ class ReservedWordFixture(AssertsCompiledSQL):
         )
 
         from sqlalchemy.dialects.mysql import reserved_words
-
-        reserved_words.RESERVED_WORDS_MARIADB.add("mdb_reserved")
-        reserved_words.RESERVED_WORDS_MYSQL.add("mysql_reserved")
-        reserved_words.RESERVED_WORDS_MYSQL.add("mdb_mysql_reserved")
-        reserved_words.RESERVED_WORDS_MARIADB.add("mdb_mysql_reserved")
-
-        try:
+        from sqlalchemy.dialects.mysql.base import MariaDBIdentifierPreparer
+        from sqlalchemy.dialects.mysql.base import MySQLIdentifierPreparer
+
+        # the reserved word collections are immutable frozensets bound
+        # to the preparer classes, so patch the class attributes
+        with (
+            mock.patch.object(
+                MySQLIdentifierPreparer,
+                "reserved_words",
+                reserved_words.RESERVED_WORDS_MYSQL
+                | {"mysql_reserved", "mdb_mysql_reserved"},
+            ),
+            mock.patch.object(
+                MariaDBIdentifierPreparer,
+                "reserved_words",
+                reserved_words.RESERVED_WORDS_MARIADB
+                | {"mdb_reserved", "mdb_mysql_reserved"},
+            ),
+        ):
             yield table, expected_mysql, expected_mdb
-        finally:
-            reserved_words.RESERVED_WORDS_MARIADB.discard("mdb_reserved")
-            reserved_words.RESERVED_WORDS_MYSQL.discard("mysql_reserved")
-            reserved_words.RESERVED_WORDS_MYSQL.discard("mdb_mysql_reserved")
-            reserved_words.RESERVED_WORDS_MARIADB.discard("mdb_mysql_reserved")
 
 
 class CompileTest(ReservedWordFixture, fixtures.TestBase, AssertsCompiledSQL):
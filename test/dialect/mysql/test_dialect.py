@@ -189,6 +189,52 @@ class BackendDialectTest(
 class DialectTest(fixtures.TestBase):
     __backend__ = True
 
+    @testing.combinations(
+        "aiomysql",
+        "asyncmy",
+        "cymysql",
+        "mariadbconnector",
+        "mysqlconnector",
+        "mysqldb",
+        "pymysql",
+        "pyodbc",
+        argnames="driver_name",
+    )
+    def test_supports_statement_cache(self, driver_name):
+        """the compiled cache opt-in must be declared directly on every
+        concrete dialect class, as it is checked via ``__dict__``"""
+
+        driver_mod = __import__(
+            f"sqlalchemy.dialects.mysql.{driver_name}"
+        ).dialects.mysql
+        cls = getattr(driver_mod, driver_name).dialect
+
+        in_("supports_statement_cache", cls.__dict__)
+        is_(cls.__dict__["supports_statement_cache"], True)
+
+    def test_supports_statement_cache_base_classes(self):
+        """check the dialect base classes themselves; the package
+        ``__init__`` rebinds ``base.dialect`` to the default driver
+        class, so routing through module attributes would miss these"""
+
+        from sqlalchemy.dialects.mysql.base import MySQLDialect
+        from sqlalchemy.dialects.mysql.mariadb import MariaDBDialect
+
+        for cls in (MySQLDialect, MariaDBDialect):
+            in_("supports_statement_cache", cls.__dict__)
+            is_(cls.__dict__["supports_statement_cache"], True)
+
+    @testing.combinations("mysqldb", "pymysql", argnames="driver_name")
+    def test_supports_statement_cache_mariadb_loader(self, driver_name):
+        """the MariaDBDialect_<driver> classes synthesized by the
+        mariadb loader must also opt in directly"""
+
+        from sqlalchemy.dialects.mysql import mariadb
+
+        cls = mariadb.loader(driver_name)
+        in_("supports_statement_cache", cls.__dict__)
+        is_(cls.__dict__["supports_statement_cache"], True)
+
     @testing.combinations(
         (None, "cONnection was kILLEd", "InternalError", "pymysql", True),
         (None, "cONnection aLREady closed", "InternalError", "pymysql", True),
@@ -30,6 +30,9 @@ from sqlalchemy import UnicodeText
 from sqlalchemy import UniqueConstraint
 from sqlalchemy.dialects.mysql import base as mysql
 from sqlalchemy.dialects.mysql import reflection as _reflection
+from sqlalchemy.engine import ObjectKind
+from sqlalchemy.engine import ObjectScope
+from sqlalchemy.engine.reflection import ReflectionDefaults
 from sqlalchemy.schema import CreateIndex
 from sqlalchemy.testing import AssertsCompiledSQL
 from sqlalchemy.testing import eq_
@@ -1586,3 +1589,173 @@ class RawReflectionTest(fixtures.TestBase):
     )
     def test_is_view(self, sql: str, expected: bool) -> None:
         is_(self.parser._check_view(sql), expected)
+
+
+class MultiReflectionBatchTest(fixtures.TestBase):
+    """mock-based tests for the batched foreign key path; no database
+    required."""
+
+    def test_multi_fk_correction_runs_once_per_batch(self):
+        """the MySQL 8 casing correction runs once for all tables in a
+        batch, not once per table as in the single-table path."""
+
+        dialect = mysql.dialect()
+        dialect._needs_correct_for_88718_96365 = True
+        connection = mock.Mock()
+
+        fkeys_by_table = {
+            "t1": [{"name": "fk1"}],
+            "t2": [{"name": "fk2"}],
+            "t3": [],
+        }
+
+        with mock.patch.object(
+            mysql.MySQLDialect,
+            "_get_raw_foreign_keys",
+            side_effect=lambda connection, table_name, schema=None, **kw: (
+                fkeys_by_table[table_name]
+            ),
+        ) as raw_fn, mock.patch.object(
+            mysql.MySQLDialect, "_correct_for_mysql_bugs_88718_96365"
+        ) as correct_fn:
+            result = dict(
+                dialect.get_multi_foreign_keys(
+                    connection,
+                    schema=None,
+                    filter_names=["t1", "t2", "t3"],
+                    kind=ObjectKind.ANY,
+                    scope=ObjectScope.ANY,
+                )
+            )
+
+        eq_(raw_fn.call_count, 3)
+        eq_(correct_fn.call_count, 1)
+        # the correction receives every fk record from the batch at once
+        eq_(
+            correct_fn.mock_calls[0].args[0],
+            [{"name": "fk1"}, {"name": "fk2"}],
+        )
+
+        eq_(result[(None, "t1")], [{"name": "fk1"}])
+        eq_(result[(None, "t2")], [{"name": "fk2"}])
+        eq_(result[(None, "t3")], ReflectionDefaults.foreign_keys())
+
+    def test_multi_fk_correction_skipped(self):
+        """no information_schema round trip at all when the server
+        version doesn't need the correction, or the batch has no fks."""
+
+        dialect = mysql.dialect()
+        dialect._needs_correct_for_88718_96365 = False
+        connection = mock.Mock()
+
+        with mock.patch.object(
+            mysql.MySQLDialect,
+            "_get_raw_foreign_keys",
+            side_effect=lambda connection, table_name, schema=None, **kw: [],
+        ), mock.patch.object(
+            mysql.MySQLDialect, "_correct_for_mysql_bugs_88718_96365"
+        ) as correct_fn:
+            dict(
+                dialect.get_multi_foreign_keys(
+                    connection,
+                    schema=None,
+                    filter_names=["t1"],
+                    kind=ObjectKind.ANY,
+                    scope=ObjectScope.ANY,
+                )
+            )
+
+            dialect._needs_correct_for_88718_96365 = True
+            dict(
+                dialect.get_multi_foreign_keys(
+                    connection,
+                    schema=None,
+                    filter_names=["t1"],
+                    kind=ObjectKind.ANY,
+                    scope=ObjectScope.ANY,
+                )
+            )
+
+        eq_(correct_fn.call_count, 0)
+
+
+class PersistentReflectionCacheTest(fixtures.TestBase):
+    """tests for the cross-inspector reflection cache enabled by
+    :meth:`.MySQLDialect._persistent_reflection_cache`."""
+
+    def _setup_parser_fixture(self):
+        dialect = mysql.dialect()
+        # the cross-call cache key includes the server version
+        dialect.server_version_info = (8, 0, 34)
+        connection = mock.Mock()
+        return dialect, connection
+
+    def test_cache_hit_across_inspectors(self):
+        dialect, connection = self._setup_parser_fixture()
+
+        with mock.patch.object(
+            mysql.MySQLDialect,
+            "_setup_parser_impl",
+            side_effect=lambda connection, table_name, schema=None: (
+                mock.Mock()
+            ),
+        ) as impl_fn:
+            with dialect._persistent_reflection_cache():
+                # fresh info_cache dicts simulate separate Inspector
+                # instances
+                first = dialect._setup_parser(
+                    connection, "t1", None, info_cache={}
+                )
+                second = dialect._setup_parser(
+                    connection, "t1", None, info_cache={}
+                )
+                eq_(impl_fn.call_count, 1)
+                is_(second, first)
+
+                dialect._setup_parser(connection, "t2", None, info_cache={})
+                eq_(impl_fn.call_count, 2)
+
+            # cache is dropped on exit
+            is_(dialect._cross_call_reflection_cache, None)
+            dialect._setup_parser(connection, "t1", None, info_cache={})
+            eq_(impl_fn.call_count, 3)
+
+    def test_nested_use_keeps_outer_cache(self):
+        dialect, connection = self._setup_parser_fixture()
+
+        with mock.patch.object(
+            mysql.MySQLDialect,
+            "_setup_parser_impl",
+            side_effect=lambda connection, table_name, schema=None: (
+                mock.Mock()
+            ),
+        ) as impl_fn:
+            with dialect._persistent_reflection_cache():
+                first = dialect._setup_parser(
+                    connection, "t1", None, info_cache={}
+                )
+                with dialect._persistent_reflection_cache():
+                    inner = dialect._setup_parser(
+                        connection, "t1", None, info_cache={}
+                    )
+                is_(inner, first)
+                # the nested exit must not discard the outer cache
+                third = dialect._setup_parser(
+                    connection, "t1", None, info_cache={}
+                )
+                is_(third, first)
+            eq_(impl_fn.call_count, 1)
+
+    def test_disabled_outside_context(self):
+        dialect, connection = self._setup_parser_fixture()
+
+        with mock.patch.object(
+            mysql.MySQLDialect,
+            "_setup_parser_impl",
+            side_effect=lambda connection, table_name, schema=None: (
+                mock.Mock()
+            ),
+        ) as impl_fn:
+            dialect._setup_parser(connection, "t1", None, info_cache={})
+            dialect._setup_parser(connection, "t1", None, info_cache={})
+            eq_(impl_fn.call_count, 2)
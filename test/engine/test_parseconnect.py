@@ -919,6 +919,23 @@ class CreateEngineTest(fixtures.TestBase):
         # but we should at least find one
         ne_(successes, 0, "No default drivers found.")
 
+    @testing.combinations(
+        "mariadb+bogusdriver://",
+        "mysql+bogusdriver://",
+        "nosuchdialect://",
+        argnames="url_str",
+    )
+    def test_unknown_dialect_or_driver(self, url_str):
+        """an unresolvable dialect or driver raises NoSuchModuleError,
+        not a raw ImportError from the internal module path."""
+
+        assert_raises_message(
+            exc.NoSuchModuleError,
+            "Can't load plugin: sqlalchemy.dialects:",
+            create_engine,
+            url_str,
+        )
+
 
 class CreatePoolTest(fixtures.TestBase):
     @fixture